@@ -7,30 +7,41 @@ It has been split into multiple submodules for better organization.
 # Export main entry point
 from .commands import main
 
-# Export setup_frost_credentials for backward compatibility (used by config.py)
-from .credentials import setup_frost_credentials
-
-# Export other commonly used functions for backward compatibility
-from .menu import _setup_credentials
-from .applications import (
-    _get_application_status,
-    _show_application_status,
-    _add_application_to_config,
-)
-from .credentials import (
-    _setup_postgres_credentials,
-    _setup_mqtt_credentials,
-    _setup_tomcat_users,
-    _setup_application_credentials,
-)
-from .tokens import _setup_token_file, _manage_tokens
-from .system_checks import (
-    _check_existing_and_valid_credentials,
-    _get_missing_mandatory,
-    _check_containers_running,
-    _check_postgres_persistent_volume,
-)
-from .commands import _validate, _push_available
+# Everything else is re-exported lazily (PEP 562) so that `stu validate` and
+# `stu start` do not import the interactive menu, credential and application
+# modules on every invocation.
+_LAZY_EXPORTS = {
+    # setup_frost_credentials kept for backward compatibility (used by config.py)
+    "setup_frost_credentials": ".credentials",
+    "_setup_credentials": ".menu",
+    "_get_application_status": ".applications",
+    "_show_application_status": ".applications",
+    "_add_application_to_config": ".applications",
+    "_setup_postgres_credentials": ".credentials",
+    "_setup_mqtt_credentials": ".credentials",
+    "_setup_tomcat_users": ".credentials",
+    "_setup_application_credentials": ".credentials",
+    "_setup_token_file": ".tokens",
+    "_manage_tokens": ".tokens",
+    "_check_existing_and_valid_credentials": ".system_checks",
+    "_get_missing_mandatory": ".system_checks",
+    "_check_containers_running": ".system_checks",
+    "_check_postgres_persistent_volume": ".system_checks",
+    "_validate": ".commands",
+    "_push_available": ".commands",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
 
 __all__ = [
     "main",
@@ -1,37 +1,170 @@
 """Application management functions."""
 
 # standard
-import inspect
+import functools
 import json
 import logging
+import operator
+import os
 from pathlib import Path
 
 # external
-import yaml
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich import print as rprint
 
 # internal
-from ..paths import CREDENTIALS_DIR, TOKENS_DIR, APPLICATION_CONFIG_FILE
-from ..connections import HTTPSensorApplicationConnection, MQTTSensorApplicationConnection
+from ..paths import TOKENS_DIR, APPLICATION_CONFIG_FILE, APPLICATION_CREDENTIALS_FILE
+from .files import _atomic_open
 
 logger = logging.getLogger("st-utils")
 console = Console()
 
+# Status icon indexed by the 'configured' flag
+STATUS_ICONS = ("[red]✗[/red]", "[green]✓[/green]")
+AUTH_LABELS = {"credentials": "Credentials", "tokens": "Tokens"}
+MISSING_CREDENTIALS_NOTE = "[yellow]⚠️  Missing in application_credentials.json[/yellow]"
+# Config keys that only MQTT applications define
+MQTT_CONFIG_KEYS = frozenset(("host", "port", "topic"))
+
+# Config files above this size (bytes) are memory-mapped when loaded
+YAML_MMAP_THRESHOLD = 4096
+
+# Buffer size (bytes) for streaming YAML documents to disk
+YAML_WRITE_BUFFER = 1 << 16
+
+# Connection-specific config fields: (key, prompt label, type, default, required)
+CONNECTION_FIELDS = {
+    "http": (
+        ("interval", "Request Interval (seconds)", int, None, False),
+        ("max_retries", "Max retries", int, None, False),
+        ("expected_sensors", "Expected sensors", int, None, False),
+    ),
+    "mqtt": (
+        ("max_retries", "Max retries", int, None, False),
+        ("host", "Host", str, None, True),
+        ("port", "Port", int, 8883, True),
+        ("topic", "Topic", str, None, True),
+        ("expected_sensors", "Expected sensors", int, None, False),
+    ),
+}
+
+# Last result of _get_application_status with the mtimes it was read at
+_status_cache = {
+    "mtime_yaml": None,
+    "mtime_creds": None,
+    "mtime_tokens_dir": None,
+    "value": None,
+    "summary": None,
+}
+
+
+def _load_yaml(path: Path):
+    """
+    Load a YAML file, using the libyaml C loader when it is available.
+    
+    Files larger than YAML_MMAP_THRESHOLD bytes are memory-mapped so the parser
+    reads straight from the page cache instead of a copied Python buffer.
+    """
+    import yaml
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size > YAML_MMAP_THRESHOLD:
+            import mmap
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                return yaml.load(mapped, Loader=loader)
+        return yaml.load(f, Loader=loader)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_yaml_dump():
+    """Return yaml.dump bound to the application config dumper and format options."""
+    import yaml
+    return functools.partial(
+        yaml.dump,
+        Dumper=getattr(yaml, "CSafeDumper", yaml.SafeDumper),
+        default_flow_style=False,
+        sort_keys=False,
+        indent=2,
+    )
+
+
+def _dump_yaml(data, path: Path):
+    """
+    Write data to a YAML file, using the libyaml C dumper when it is available.
+    
+    The document is streamed through `_atomic_open`, so a failed write never
+    leaves a truncated config behind.
+    """
+    with _atomic_open(path, buffering=YAML_WRITE_BUFFER) as f:
+        _get_yaml_dump()(data, f)
+
+
+def _file_mtime(path: Path):
+    """Return the modification time of a file in nanoseconds, or None if missing."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _invalidate_application_status():
+    """Drop the cached application status so the next lookup rereads the files."""
+    _status_cache["value"] = None
+
 
 def _get_application_status():
     """
     Get status of all configured applications.
     
+    The result is cached and reused until the application config,
+    application_credentials.json or the tokens directory changes on disk, or
+    until _invalidate_application_status is called. Callers must not mutate it.
+    
     Returns:
         Dictionary mapping app_name to dict with:
             - 'auth_type': 'credentials' or 'tokens'
             - 'configured': bool (whether auth is set up)
             - 'connection_class': str
     """
+    mtime_yaml = _file_mtime(APPLICATION_CONFIG_FILE)
+    mtime_creds = _file_mtime(APPLICATION_CREDENTIALS_FILE)
+    mtime_tokens_dir = _file_mtime(TOKENS_DIR)
+    if (
+        _status_cache["value"] is not None
+        and _status_cache["mtime_yaml"] == mtime_yaml
+        and _status_cache["mtime_creds"] == mtime_creds
+        and _status_cache["mtime_tokens_dir"] == mtime_tokens_dir
+    ):
+        return _status_cache["value"]
+    
+    app_status = _read_application_status()
+    _status_cache.update(
+        mtime_yaml=mtime_yaml,
+        mtime_creds=mtime_creds,
+        mtime_tokens_dir=mtime_tokens_dir,
+        value=app_status,
+        summary=None,
+    )
+    return app_status
+
+
+def _get_application_summary():
+    """
+    Get the number of configured applications and the total.
+    
+    Counted once per application status and cached alongside it.
+    
+    Returns:
+        Tuple of (configured, total)
+    """
+    app_status = _get_application_status()
+    if _status_cache["summary"] is None:
+        configured = sum(map(operator.itemgetter("configured"), app_status.values()))
+        _status_cache["summary"] = (configured, len(app_status))
+    return _status_cache["summary"]
+
+
+def _read_application_status():
+    """Read the application config and credentials to build the application status."""
     app_status = {}
     
     # Read application config file
@@ -39,8 +172,7 @@ def _get_application_status():
         return app_status
     
     try:
-        with open(APPLICATION_CONFIG_FILE, "r") as f:
-            config = yaml.safe_load(f)
+        config = _load_yaml(APPLICATION_CONFIG_FILE)
     except Exception as e:
         logger.warning(f"Could not read application config: {e}")
         return app_status
@@ -50,14 +182,22 @@ def _get_application_status():
     
     # Read application credentials if they exist
     app_creds = {}
-    app_creds_file = CREDENTIALS_DIR / "application_credentials.json"
+    app_creds_file = APPLICATION_CREDENTIALS_FILE
     if app_creds_file.exists():
         try:
-            with open(app_creds_file, "r") as f:
-                app_creds = json.load(f)
+            app_creds = json.loads(app_creds_file.read_bytes())
         except Exception:
             pass
     
+    # List token files once instead of checking each application's file
+    token_names = set()
+    if TOKENS_DIR.is_dir():
+        with os.scandir(TOKENS_DIR) as entries:
+            token_names = {
+                entry.name[:-5] for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            }
+    
     # Check each application
     for app_name, app_config in config["applications"].items():
         auth_type = app_config.get("authentication_type", "credentials")
@@ -69,8 +209,7 @@ def _get_application_status():
             configured = app_name in app_creds
         elif auth_type == "tokens":
             # Check if token file exists
-            token_file = TOKENS_DIR / f"{app_name}.json"
-            configured = token_file.exists()
+            configured = app_name in token_names
         
         app_status[app_name] = {
             "auth_type": auth_type,
@@ -81,6 +220,7 @@ def _get_application_status():
     return app_status
 
 
+@functools.lru_cache(maxsize=None)
 def _get_available_connection_classes(connection_type: str):
     """
     Get available connection classes for a given connection type.
@@ -89,27 +229,100 @@ def _get_available_connection_classes(connection_type: str):
         connection_type: "http" or "mqtt"
         
     Returns:
-        List of connection class names
+        Sorted tuple of connection class names
+    """
+    # Imported here: connections pulls in the MQTT/Netatmo clients and the
+    # transformers, which only the add-application flow needs
+    from ..connections import HTTP_CONNECTION_CLASSES, MQTT_CONNECTION_CLASSES
+    
+    # Concrete connection classes register themselves on definition
+    available_classes = HTTP_CONNECTION_CLASSES if connection_type == "http" else MQTT_CONNECTION_CLASSES
+    return tuple(sorted(available_classes))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_connection_class_rows(connection_type: str):
+    """
+    Get prompt rows for the available connection classes of a connection type.
+    
+    Args:
+        connection_type: "http" or "mqtt"
+        
+    Returns:
+        Tuple of (option_label, class_name) pairs, numbered from 1
     """
-    import sensorthings_utils.connections as connections_module
+    return tuple(
+        (f"[cyan][{i}][/cyan]", class_name)
+        for i, class_name in enumerate(_get_available_connection_classes(connection_type), 1)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _header_panel(title: str, border_style: str):
+    """Return a fitted header panel for a constant title, built once and reused."""
+    from rich.panel import Panel
+    return Panel.fit(title, border_style=border_style)
+
+
+def _status_table(title, rows):
+    """Build a status table from (status_icon, app_name, connection_class, notes) rows."""
+    from rich.table import Table
+    
+    table = Table(title=title, show_header=True, header_style="bold")
+    table.add_column("Status", style="magenta", width=8)
+    table.add_column("Application", style="cyan")
+    table.add_column("Connection", style="blue")
+    table.add_column("Notes", style="yellow")
+    for row in rows:
+        table.add_row(*row)
+    return table
+
+
+def _print_status_screen(total, configured, creds_rows, token_rows, unconfigured_apps):
+    """Print the application status tables, summary and quick setup list."""
+    from rich.table import Table
     
-    base_class = HTTPSensorApplicationConnection if connection_type == "http" else MQTTSensorApplicationConnection
-    available_classes = []
+    if creds_rows:
+        console.print(_status_table("📋 Applications using Credentials", creds_rows))
+    if token_rows:
+        console.print(_status_table("🔑 Applications using Tokens", token_rows))
     
-    # Get all members of the connections module
-    for name, obj in inspect.getmembers(connections_module):
-        # Check if it's a class, ends with "Connection", and is a subclass of the base class
-        if (inspect.isclass(obj) and 
-            name.endswith("Connection") and 
-            issubclass(obj, base_class) and 
-            obj is not base_class):
-            available_classes.append(name)
+    # Summary
+    console.print(f"\n[bold]Summary:[/bold] [green]{configured}[/green]/[cyan]{total}[/cyan] applications configured")
     
-    return sorted(available_classes)
+    # Quick setup list for unconfigured apps
+    if unconfigured_apps:
+        console.print(_header_panel("[bold]Unconfigured Applications - Quick Setup[/bold]", "yellow"))
+        
+        unconfig_table = Table(show_header=False, box=None, padding=(0, 2))
+        for i, (app_name, status) in enumerate(unconfigured_apps, 1):
+            auth_type_label = "Credentials" if status["auth_type"] == "credentials" else "Token file"
+            unconfig_table.add_row(f"[cyan][{i}][/cyan]", f"{app_name} ([dim]{auth_type_label}[/dim])")
+        unconfig_table.add_row(f"[cyan][{len(unconfigured_apps) + 1}][/cyan]", "[dim]Skip / Manage applications[/dim]")
+        
+        console.print(unconfig_table)
+
+
+def _print_management_menu(app_list):
+    """Print the application management menu."""
+    from rich.table import Table
+    
+    console.print(_header_panel("[bold]Application Management[/bold]", "blue"))
+    
+    manage_table = Table(show_header=False, box=None, padding=(0, 2))
+    for i, (app_name, status) in enumerate(app_list, 1):
+        status_icon = STATUS_ICONS[status["configured"]]
+        auth_label = AUTH_LABELS.get(status["auth_type"], status["auth_type"])
+        manage_table.add_row(f"[cyan][{i}][/cyan]", f"{status_icon} {app_name} ([dim]{auth_label}[/dim])")
+    manage_table.add_row(f"[cyan][{len(app_list) + 1}][/cyan]", "[dim]Back to main menu[/dim]")
+    
+    console.print(manage_table)
 
 
 def _show_application_status():
     """Display status of all configured applications and allow setup of missing ones."""
+    from rich.panel import Panel
+    from rich.prompt import IntPrompt
     from .credentials import _setup_application_credentials
     from .tokens import _setup_token_file
     
@@ -124,64 +337,35 @@ def _show_application_status():
             return
         
         # Create status tables
-        apps_by_auth = {"credentials": [], "tokens": []}
+        creds_rows = []
+        token_rows = []
         unconfigured_apps = []
+        configured = 0
         
         for app_name, status in app_status.items():
-            apps_by_auth[status["auth_type"]].append((app_name, status))
-            if not status["configured"]:
+            auth_type = status["auth_type"]
+            is_configured = status["configured"]
+            if auth_type == "credentials":
+                notes = "" if is_configured else MISSING_CREDENTIALS_NOTE
+                rows = creds_rows
+            elif auth_type == "tokens":
+                notes = "" if is_configured else f"[yellow]⚠️  Missing token file: {app_name}.json[/yellow]"
+                rows = token_rows
+            else:
+                logger.warning(f"Unknown authentication type '{auth_type}' for {app_name}")
+                continue
+            rows.append((STATUS_ICONS[is_configured], app_name, status["connection_class"], notes))
+            if is_configured:
+                configured += 1
+            else:
                 unconfigured_apps.append((app_name, status))
         
-        # Show credentials-based apps
-        if apps_by_auth["credentials"]:
-            creds_table = Table(title="📋 Applications using Credentials", show_header=True, header_style="bold")
-            creds_table.add_column("Status", style="magenta", width=8)
-            creds_table.add_column("Application", style="cyan")
-            creds_table.add_column("Connection", style="blue")
-            creds_table.add_column("Notes", style="yellow")
-            
-            for app_name, status in apps_by_auth["credentials"]:
-                status_icon = "[green]✓[/green]" if status["configured"] else "[red]✗[/red]"
-                notes = "" if status["configured"] else "[yellow]⚠️  Missing in application_credentials.json[/yellow]"
-                creds_table.add_row(status_icon, app_name, status['connection_class'], notes)
-            
-            console.print(creds_table)
-        
-        # Show token-based apps
-        if apps_by_auth["tokens"]:
-            tokens_table = Table(title="🔑 Applications using Tokens", show_header=True, header_style="bold")
-            tokens_table.add_column("Status", style="magenta", width=8)
-            tokens_table.add_column("Application", style="cyan")
-            tokens_table.add_column("Connection", style="blue")
-            tokens_table.add_column("Notes", style="yellow")
-            
-            for app_name, status in apps_by_auth["tokens"]:
-                status_icon = "[green]✓[/green]" if status["configured"] else "[red]✗[/red]"
-                notes = "" if status["configured"] else f"[yellow]⚠️  Missing token file: {app_name}.json[/yellow]"
-                tokens_table.add_row(status_icon, app_name, status['connection_class'], notes)
-            
-            console.print(tokens_table)
-        
-        # Summary
-        total = len(app_status)
-        configured = sum(1 for s in app_status.values() if s["configured"])
-        console.print(f"\n[bold]Summary:[/bold] [green]{configured}[/green]/[cyan]{total}[/cyan] applications configured")
+        # Render the status screen into the console buffer and flush it once
+        with console:
+            _print_status_screen(len(app_status), configured, creds_rows, token_rows, unconfigured_apps)
         
         # Interactive setup for unconfigured apps
         if unconfigured_apps:
-            console.print(Panel.fit(
-                "[bold]Unconfigured Applications - Quick Setup[/bold]",
-                border_style="yellow"
-            ))
-            
-            unconfig_table = Table(show_header=False, box=None, padding=(0, 2))
-            for i, (app_name, status) in enumerate(unconfigured_apps, 1):
-                auth_type_label = "Credentials" if status["auth_type"] == "credentials" else "Token file"
-                unconfig_table.add_row(f"[cyan][{i}][/cyan]", f"{app_name} ([dim]{auth_type_label}[/dim])")
-            unconfig_table.add_row(f"[cyan][{len(unconfigured_apps) + 1}][/cyan]", "[dim]Skip / Manage applications[/dim]")
-            
-            console.print(unconfig_table)
-            
             choice = IntPrompt.ask(
                 f"\nSelect option",
                 default=len(unconfigured_apps) + 1
@@ -218,20 +402,9 @@ def _show_application_status():
                 pass
         
         # Management menu
-        console.print(Panel.fit(
-            "[bold]Application Management[/bold]",
-            border_style="blue"
-        ))
-        
         app_list = list(app_status.items())
-        manage_table = Table(show_header=False, box=None, padding=(0, 2))
-        for i, (app_name, status) in enumerate(app_list, 1):
-            status_icon = "[green]✓[/green]" if status["configured"] else "[red]✗[/red]"
-            auth_label = "Credentials" if status["auth_type"] == "credentials" else "Tokens"
-            manage_table.add_row(f"[cyan][{i}][/cyan]", f"{status_icon} {app_name} ([dim]{auth_label}[/dim])")
-        manage_table.add_row(f"[cyan][{len(app_list) + 1}][/cyan]", "[dim]Back to main menu[/dim]")
-        
-        console.print(manage_table)
+        with console:
+            _print_management_menu(app_list)
         
         choice = IntPrompt.ask(
             f"\nSelect option",
@@ -258,18 +431,76 @@ def _show_application_status():
 
 def _get_connection_type_from_config(app_config: dict) -> str:
     """Determine connection type (http/mqtt) from application config."""
-    # MQTT connections typically have 'host', 'port', and 'topic'
-    if "host" in app_config or "topic" in app_config:
+    # MQTT connections typically have 'host', 'port', and 'topic'; HTTP
+    # connections typically have 'interval'. Default to http if unclear.
+    if not MQTT_CONFIG_KEYS.isdisjoint(app_config.keys()):
         return "mqtt"
-    # HTTP connections typically have 'interval'
-    elif "interval" in app_config:
-        return "http"
-    # Default to http if unclear
     return "http"
 
 
+def _prompt_optional_int(prompt: str, default=""):
+    """
+    Prompt for an optional integer value, asking again until the input is valid.
+    
+    Args:
+        prompt: Prompt text
+        default: Value used when the user presses Enter (empty for none)
+        
+    Returns:
+        The entered integer, or None if the input was left empty
+    """
+    from rich.prompt import Prompt
+    
+    while True:
+        value = Prompt.ask(prompt, default=str(default) if default else "").strip()
+        if not value:
+            return None
+        try:
+            return int(value)
+        except ValueError:
+            console.print("[red]Invalid value. Please enter a whole number.[/red]")
+
+
+def _prompt_fields(fields, current_config: dict, new_config: dict):
+    """
+    Prompt for connection-specific config fields.
+    
+    Empty input keeps the current value; a required field without one is
+    asked for again until it is given.
+    
+    Args:
+        fields: Field specs from CONNECTION_FIELDS
+        current_config: Existing values, used as prompt defaults and kept on empty input
+        new_config: Dictionary the answers are written into
+    """
+    from rich.prompt import Prompt
+    
+    for i, (key, label, kind, default, required) in enumerate(fields):
+        prompt = f"\n{label}" if i == 0 else label
+        current = current_config.get(key, default)
+        while True:
+            if kind is int:
+                value = _prompt_optional_int(prompt, current)
+            elif current:
+                value = Prompt.ask(prompt, default=str(current))
+            else:
+                value = Prompt.ask(prompt)
+            if value is None or value == "":
+                value = current
+            if not required or (value is not None and value != ""):
+                break
+            console.print(f"[bold red]{label} is required.[/bold red]")
+        if value is None or value == "":
+            continue
+        new_config[key] = value
+
+
 def _manage_application(app_name: str):
     """Manage a specific application - modify or remove."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.prompt import Prompt
+    
     while True:
         menu_table = Table(show_header=False, box=None, padding=(0, 2))
         menu_table.add_row("[cyan][1][/cyan]", "Modify configuration")
@@ -308,14 +539,17 @@ def _manage_application(app_name: str):
 
 def _modify_application_config(app_name: str) -> bool:
     """Modify an existing application configuration."""
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.prompt import Prompt
+    
     # Load existing config
     if not APPLICATION_CONFIG_FILE.exists() or not APPLICATION_CONFIG_FILE.is_file():
         console.print("[bold red]Error:[/bold red] Application config file not found")
         return False
     
     try:
-        with open(APPLICATION_CONFIG_FILE, "r") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(APPLICATION_CONFIG_FILE) or {}
     except Exception as e:
         console.print(f"[bold red]Error reading config file:[/bold red] {e}")
         return False
@@ -365,9 +599,10 @@ def _modify_application_config(app_name: str) -> bool:
     console.print(f"\n[bold]Current connection class:[/bold] {current_class}")
     console.print(f"[bold]Available {connection_type.upper()} connection classes:[/bold]")
     class_table = Table(show_header=False, box=None, padding=(0, 2))
-    for i, class_name in enumerate(available_classes, 1):
-        marker = " [dim]<-- current[/dim]" if class_name == current_class else ""
-        class_table.add_row(f"[cyan][{i}][/cyan]", f"{class_name}{marker}")
+    for option_label, class_name in _get_connection_class_rows(connection_type):
+        if class_name == current_class:
+            class_name = f"{class_name} [dim]<-- current[/dim]"
+        class_table.add_row(option_label, class_name)
     console.print(class_table)
     
     choice = Prompt.ask(
@@ -386,112 +621,21 @@ def _modify_application_config(app_name: str) -> bool:
             console.print("[red]Invalid input.[/red]")
             return False
     
-    # HTTP-specific fields
-    if connection_type == "http":
-        current_interval = current_config.get("interval", "")
-        new_interval = Prompt.ask(
-            f"\nRequest Interval (seconds)",
-            default=str(current_interval) if current_interval else ""
-        )
-        if new_interval:
-            try:
-                new_config["interval"] = int(new_interval)
-            except ValueError:
-                console.print("[yellow]Invalid interval value. Keeping current value.[/yellow]")
-                if current_interval:
-                    new_config["interval"] = current_interval
-        else:
-            if current_interval:
-                new_config["interval"] = current_interval
-        
-        current_max_retries = current_config.get("max_retries", "")
-        new_max_retries = Prompt.ask(
-            "Max retries",
-            default=str(current_max_retries) if current_max_retries else ""
-        )
-        if new_max_retries:
-            try:
-                new_config["max_retries"] = int(new_max_retries)
-            except ValueError:
-                console.print("[yellow]Invalid max_retries value. Keeping current value.[/yellow]")
-                new_config["max_retries"] = current_max_retries if current_max_retries else None
-        else:
-            if current_max_retries:
-                new_config["max_retries"] = current_max_retries
-        
-        current_expected_sensors = current_config.get("expected_sensors", "")
-        new_expected_sensors = Prompt.ask(
-            "Expected sensors",
-            default=str(current_expected_sensors) if current_expected_sensors else ""
-        )
-        if new_expected_sensors:
-            try:
-                new_config["expected_sensors"] = int(new_expected_sensors)
-            except ValueError:
-                console.print("[yellow]Invalid expected_sensors value. Keeping current value.[/yellow]")
-                new_config["expected_sensors"] = current_expected_sensors if current_expected_sensors else None
-        else:
-            if current_expected_sensors:
-                new_config["expected_sensors"] = current_expected_sensors
+    # Connection-specific fields
+    _prompt_fields(CONNECTION_FIELDS[connection_type], current_config, new_config)
     
-    # MQTT-specific fields
-    else:
-        current_max_retries = current_config.get("max_retries", "")
-        new_max_retries = Prompt.ask(
-            "\nMax retries",
-            default=str(current_max_retries) if current_max_retries else ""
-        )
-        if new_max_retries:
-            try:
-                new_config["max_retries"] = int(new_max_retries)
-            except ValueError:
-                console.print("[yellow]Invalid max_retries value. Keeping current value.[/yellow]")
-                new_config["max_retries"] = current_max_retries if current_max_retries else None
-        else:
-            if current_max_retries:
-                new_config["max_retries"] = current_max_retries
-        
-        current_host = current_config.get("host", "")
-        new_host = Prompt.ask("Host", default=current_host)
-        new_config["host"] = new_host if new_host else current_host
-        
-        current_port = current_config.get("port", 8883)
-        new_port = Prompt.ask("Port", default=str(current_port))
-        if new_port:
-            try:
-                new_config["port"] = int(new_port)
-            except ValueError:
-                console.print("[yellow]Invalid port value. Keeping current value.[/yellow]")
-                new_config["port"] = current_port
-        else:
-            new_config["port"] = current_port
-        
-        current_topic = current_config.get("topic", "")
-        new_topic = Prompt.ask("Topic", default=current_topic)
-        new_config["topic"] = new_topic if new_topic else current_topic
-        
-        current_expected_sensors = current_config.get("expected_sensors", "")
-        new_expected_sensors = Prompt.ask(
-            "Expected sensors",
-            default=str(current_expected_sensors) if current_expected_sensors else ""
-        )
-        if new_expected_sensors:
-            try:
-                new_config["expected_sensors"] = int(new_expected_sensors)
-            except ValueError:
-                console.print("[yellow]Invalid expected_sensors value. Keeping current value.[/yellow]")
-                new_config["expected_sensors"] = current_expected_sensors if current_expected_sensors else None
-        else:
-            if current_expected_sensors:
-                new_config["expected_sensors"] = current_expected_sensors
+    # Nothing to save if every prompt kept its current value
+    if new_config == current_config:
+        console.print("\n[dim]No changes made.[/dim]")
+        return False
     
     # Update config
     config["applications"][app_name] = new_config
     
     # Save config
     try:
-        with open(APPLICATION_CONFIG_FILE, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+        _dump_yaml(config, APPLICATION_CONFIG_FILE)
+        _invalidate_application_status()
         return True
     except Exception as e:
         console.print(f"[bold red]Error saving config file:[/bold red] {e}")
@@ -500,14 +644,18 @@ def _modify_application_config(app_name: str) -> bool:
 
 def _remove_application(app_name: str) -> bool:
     """Remove an application from config and optionally remove credentials/tokens."""
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from .credentials import _atomic_write_json
+    from .system_checks import _invalidate_credentials_cache
+    
     # Load existing config
     if not APPLICATION_CONFIG_FILE.exists() or not APPLICATION_CONFIG_FILE.is_file():
         console.print("[bold red]Error:[/bold red] Application config file not found")
         return False
     
     try:
-        with open(APPLICATION_CONFIG_FILE, "r") as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_yaml(APPLICATION_CONFIG_FILE) or {}
     except Exception as e:
         console.print(f"[bold red]Error reading config file:[/bold red] {e}")
         return False
@@ -537,12 +685,12 @@ def _remove_application(app_name: str) -> bool:
     
     # Optionally remove credentials/tokens
     remove_auth = False
+    app_creds = {}
     if auth_type == "credentials":
-        app_creds_file = CREDENTIALS_DIR / "application_credentials.json"
+        app_creds_file = APPLICATION_CREDENTIALS_FILE
         if app_creds_file.exists():
             try:
-                with open(app_creds_file, "r") as f:
-                    app_creds = json.load(f)
+                app_creds = json.loads(app_creds_file.read_bytes())
                 if app_name in app_creds:
                     remove_auth = Confirm.ask(
                         "\nAlso remove credentials from application_credentials.json?",
@@ -563,8 +711,8 @@ def _remove_application(app_name: str) -> bool:
     
     # Save config
     try:
-        with open(APPLICATION_CONFIG_FILE, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+        _dump_yaml(config, APPLICATION_CONFIG_FILE)
+        _invalidate_application_status()
     except Exception as e:
         console.print(f"[bold red]Error saving config file:[/bold red] {e}")
         return False
@@ -572,13 +720,11 @@ def _remove_application(app_name: str) -> bool:
     # Remove credentials/tokens if requested
     if remove_auth:
         if auth_type == "credentials":
+            # Reuse the credentials loaded for the confirmation prompt
             try:
-                with open(app_creds_file, "r") as f:
-                    app_creds = json.load(f)
                 if app_name in app_creds:
                     del app_creds[app_name]
-                    with open(app_creds_file, "w") as f:
-                        json.dump(app_creds, f, indent=4)
+                    _atomic_write_json(app_creds_file, app_creds, compact=True)
                     console.print(f"[green]✓ Removed credentials for {app_name}[/green]")
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not remove credentials:[/yellow] {e}")
@@ -586,9 +732,11 @@ def _remove_application(app_name: str) -> bool:
             try:
                 if token_file.exists():
                     token_file.unlink()
+                    _invalidate_credentials_cache()
                     console.print(f"[green]✓ Deleted token file {token_file.name}[/green]")
             except Exception as e:
                 console.print(f"[yellow]Warning: Could not delete token file:[/yellow] {e}")
+        _invalidate_application_status()
     
     return True
 
@@ -601,10 +749,10 @@ def _add_application_to_config():
         On success, returns (True, app_name, auth_type)
         On failure, returns (False, None, None)
     """
-    console.print(Panel.fit(
-        "[bold]Add Application to Config[/bold]",
-        border_style="blue"
-    ))
+    from rich.table import Table
+    from rich.prompt import Prompt, Confirm, IntPrompt
+    
+    console.print(_header_panel("[bold]Add Application to Config[/bold]", "blue"))
     
     # Step 1: Ask for connection type with numeric selection
     conn_table = Table(show_header=False, box=None, padding=(0, 2))
@@ -630,8 +778,7 @@ def _add_application_to_config():
     config = {}
     if APPLICATION_CONFIG_FILE.exists() and APPLICATION_CONFIG_FILE.is_file():
         try:
-            with open(APPLICATION_CONFIG_FILE, "r") as f:
-                config = yaml.safe_load(f) or {}
+            config = _load_yaml(APPLICATION_CONFIG_FILE) or {}
         except Exception as e:
             console.print(f"[bold red]Error reading config file:[/bold red] {e}")
             return (False, None, None)
@@ -674,8 +821,8 @@ def _add_application_to_config():
         return (False, None, None)
     
     class_table = Table(show_header=False, box=None, padding=(0, 2))
-    for i, class_name in enumerate(available_classes, 1):
-        class_table.add_row(f"[cyan][{i}][/cyan]", class_name)
+    for option_label, class_name in _get_connection_class_rows(connection_type):
+        class_table.add_row(option_label, class_name)
     console.print(f"\n[bold]Available {connection_type.upper()} connection classes:[/bold]")
     console.print(class_table)
     
@@ -685,71 +832,16 @@ def _add_application_to_config():
     )
     app_config["connection_class"] = available_classes[choice - 1]
     
-    if connection_type == "http":
-        # HTTP-specific fields
-        interval = Prompt.ask("\nRequest Interval (seconds)", default="")
-        if interval:
-            try:
-                app_config["interval"] = int(interval)
-            except ValueError:
-                console.print("[yellow]Invalid interval value. Skipping.[/yellow]")
-        
-        max_retries = Prompt.ask("Max retries", default="")
-        if max_retries:
-            try:
-                app_config["max_retries"] = int(max_retries)
-            except ValueError:
-                console.print("[yellow]Invalid max_retries value. Skipping.[/yellow]")
-        
-        expected_sensors = Prompt.ask("Expected sensors", default="")
-        if expected_sensors:
-            try:
-                app_config["expected_sensors"] = int(expected_sensors)
-            except ValueError:
-                console.print("[yellow]Invalid expected_sensors value. Skipping.[/yellow]")
-    
-    else:  # mqtt
-        # MQTT-specific fields
-        max_retries = Prompt.ask("\nMax retries", default="")
-        if max_retries:
-            try:
-                app_config["max_retries"] = int(max_retries)
-            except ValueError:
-                console.print("[yellow]Invalid max_retries value. Skipping.[/yellow]")
-        
-        host = Prompt.ask("Host")
-        if not host:
-            console.print("[bold red]Host is required for MQTT applications.[/bold red]")
-            return (False, None, None)
-        app_config["host"] = host
-        
-        port = Prompt.ask("Port", default="8883")
-        try:
-            app_config["port"] = int(port)
-        except ValueError:
-            console.print("[yellow]Invalid port value. Using default 8883.[/yellow]")
-            app_config["port"] = 8883
-        
-        topic = Prompt.ask("Topic")
-        if not topic:
-            console.print("[bold red]Topic is required for MQTT applications.[/bold red]")
-            return (False, None, None)
-        app_config["topic"] = topic
-        
-        expected_sensors = Prompt.ask("Expected sensors", default="")
-        if expected_sensors:
-            try:
-                app_config["expected_sensors"] = int(expected_sensors)
-            except ValueError:
-                console.print("[yellow]Invalid expected_sensors value. Skipping.[/yellow]")
+    # Connection-specific fields
+    _prompt_fields(CONNECTION_FIELDS[connection_type], {}, app_config)
     
     # Add application to config
     config["applications"][app_name] = app_config
     
     # Save config
     try:
-        with open(APPLICATION_CONFIG_FILE, "w") as f:
-            yaml.safe_dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+        _dump_yaml(config, APPLICATION_CONFIG_FILE)
+        _invalidate_application_status()
         console.print(f"\n[bold green]✓ Added '{app_name}' to {APPLICATION_CONFIG_FILE.name}[/bold green]")
         auth_type = app_config.get("authentication_type", "credentials")
         return (True, app_name, auth_type)
@@ -1,52 +1,110 @@
 """CLI command handlers."""
 
 # standard
+import functools
 import os
+import sys
 from pathlib import Path
 from typing import Optional
 import subprocess
 # external
 import typer
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt, Confirm
-from rich import print as rprint
 
 # internal
-from .menu import _setup_credentials
 from ..paths import DEPLOY_DIR, START_SCRIPT, STOP_SCRIPT
-# Create typer app and console
+# Create typer app
 app = typer.Typer(
     help="st-utils CLI - SensorThings Utilities",
     rich_markup_mode="rich",
     no_args_is_help=True,
+    add_completion=False,
 )
-console = Console()
 
-# Create typer app and console
-app = typer.Typer(
-    help="st-utils CLI - SensorThings Utilities",
-    rich_markup_mode="rich",
-    no_args_is_help=True,
-)
-console = Console()
+
+@functools.lru_cache(maxsize=None)
+def _get_console():
+    """Create the shared console on first use, keeping rich off the import path."""
+    from rich.console import Console
+
+    return Console()
+
+
+YAML_SUFFIXES = (".yaml", ".yml")
+# Number of files from which validation is spread across a process pool
+PARALLEL_VALIDATION_THRESHOLD = 16
+
+
+def _iter_yaml_files(root: str):
+    """Yield paths of non-template YAML files under root, recursively.
+
+    Uses os.scandir so directory entry types come back with the listing and
+    names are filtered before any extra stat call. Like os.walk, unreadable
+    directories are skipped and entries that cannot be stat'ed are treated
+    as files.
+    """
+    stack = [root]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    is_dir = False
+                if is_dir:
+                    stack.append(entry.path)
+                elif entry.name.endswith(YAML_SUFFIXES) and not entry.name.startswith("template"):
+                    yield entry.path
+
+
+def _validate_one(path: str) -> tuple[str, list[str]]:
+    """Validate a single sensor configuration file.
+
+    Top-level so it can be pickled into a worker process.
+
+    Args:
+        path: Path to the YAML configuration file
+
+    Returns:
+        Tuple of (path, list_of_errors)
+    """
+    from sensorthings_utils.sensor_things.extensions import SensorConfig
+
+    is_valid, messages = SensorConfig.validate(path)
+    # a valid config reports a success message, not errors
+    return path, [] if is_valid else messages
+
+
+def _iter_validation_results(validation_files: list[str]):
+    """Yield (path, errors) for each file in input order, as results arrive.
+
+    Files are independent and parsing is CPU-bound, so large batches are
+    fanned out across a process pool. Smaller batches are validated in this
+    process, where starting the workers would cost more than it saves.
+    """
+    if len(validation_files) < PARALLEL_VALIDATION_THRESHOLD:
+        for path in validation_files:
+            yield _validate_one(path)
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        yield from executor.map(_validate_one, validation_files, chunksize=4)
 
 
 def _validate(
     file: Optional[Path] = typer.Argument(None, help="Config file to validate (optional).")
 ):
     """Validate sensor configuration files."""
-    from sensorthings_utils.sensor_things.extensions import SensorConfig
-    
+    console = _get_console()
     if file:
         validation_files = [str(file)]
     else:
-        validation_files = [
-            os.path.join(root, f)
-            for root, _, files in os.walk(".")
-            for f in files
-            if (f.endswith((".yaml", "yml")) and not f.startswith("template"))
-        ]
+        validation_files = list(_iter_yaml_files("."))
 
     if not validation_files:
         console.print("[yellow]No YAML files found to validate.[/yellow]")
@@ -55,16 +113,17 @@ def _validate(
     console.print(f"\n[bold]Validating {len(validation_files)} file(s)...[/bold]\n")
     
     all_valid = True
-    for f in validation_files:
-        result, errors = SensorConfig(f).check_validity()
-        if errors:
-            all_valid = False
-            console.print(f"[red]❌ {f}[/red]")
-            for e in errors:
-                console.print(f"  [red]{e}[/red]")
-        else:
-            console.print(f"[green]✓ {f}[/green]")
-    
+    for f, errors in _iter_validation_results(validation_files):
+        # buffer each file's block and flush it to the terminal once
+        with console:
+            if errors:
+                all_valid = False
+                console.print(f"[red]❌ {f}[/red]")
+                for e in errors:
+                    console.print(f"  [red]{e}[/red]")
+            else:
+                console.print(f"[green]✓ {f}[/green]")
+
     if all_valid:
         console.print("\n[bold green]All files are valid![/bold green]")
     else:
@@ -83,6 +142,7 @@ def _push_available(
     ),
 ):
     """Start the STU instance."""
+    console = _get_console()
     
     mode = "private" if private else "public"
     console.print(f"[bold]Starting STU instance in {mode} mode...[/bold]")
@@ -103,6 +163,7 @@ def _push_available(
 
 def _stop_instance():
     """Stop the STU instance."""
+    console = _get_console()
     
     console.print("[bold]Stopping STU instance...[/bold]")
     result = subprocess.run(
@@ -127,6 +188,9 @@ def _generate_config(
     ),
 ):
     """Generate sensor configuration file from template."""
+    console = _get_console()
+    from rich.panel import Panel
+    from rich.prompt import Prompt
     from .config_generator import generate_config_from_template
     from sensorthings_utils.transformers.types import SupportedSensors
     
@@ -137,42 +201,52 @@ def _generate_config(
         console.print("Supported models: milesight.am103l, milesight.am308l, netatmo.nws03")
         raise typer.Exit(1)
     
+    if sys.stdin.isatty():
+        def ask(label: str) -> str:
+            return Prompt.ask(label, default="", console=console).strip()
+    else:
+        # Scripted run: read every answer up front, one per line, in prompt order
+        answers = iter(sys.stdin.read().splitlines())
+
+        def ask(label: str) -> str:
+            return next(answers, "").strip()
+    
     # Collect user inputs with rich prompts
     console.print(Panel.fit(
         f"[bold]Generating configuration for {sensor_model_enum.value}[/bold]",
         border_style="blue"
     ))
     
-    sensor_id = Prompt.ask("Sensor ID/Name", default="").strip()
+    sensor_id = ask("Sensor ID/Name")
     if not sensor_id:
         console.print("[bold red]Error:[/bold red] Sensor ID is required")
         raise typer.Exit(1)
     
     console.print("\n[bold]Thing Configuration:[/bold]")
-    thing_name = Prompt.ask("Thing name", default="").strip()
+    thing_name = ask("Thing name")
     if not thing_name:
         console.print("[bold red]Error:[/bold red] Thing name is required")
         raise typer.Exit(1)
     
-    thing_description = Prompt.ask("Thing description", default="").strip()
+    thing_description = ask("Thing description")
     if not thing_description:
         console.print("[bold red]Error:[/bold red] Thing description is required")
         raise typer.Exit(1)
     
     console.print("\n[bold]Location Configuration:[/bold]")
-    location_name = Prompt.ask("Location name", default="").strip()
+    location_name = ask("Location name")
     if not location_name:
         console.print("[bold red]Error:[/bold red] Location name is required")
         raise typer.Exit(1)
     
-    location_description = Prompt.ask("Location description", default="").strip()
+    location_description = ask("Location description")
     if not location_description:
         console.print("[bold red]Error:[/bold red] Location description is required")
         raise typer.Exit(1)
     
     try:
-        longitude = float(Prompt.ask("Longitude", default="").strip())
-        latitude = float(Prompt.ask("Latitude", default="").strip())
+        longitude = float(ask("Longitude"))
+        latitude = float(ask("Latitude"))
     except ValueError:
         console.print("[bold red]Error:[/bold red] Longitude and latitude must be valid numbers")
         raise typer.Exit(1)
@@ -188,7 +262,7 @@ def _generate_config(
             location_description=location_description,
             longitude=longitude,
             latitude=latitude,
-            output_path=output_path,
+            output_path=output,
         )
         console.print(f"\n[bold green]✓ Configuration generated successfully:[/bold green] {output_path}")
         console.print("\n[bold]Next steps:[/bold]")
@@ -210,6 +284,8 @@ def _setup(
     token: bool = typer.Option(False, "--token", help="Setup a token file (freeform JSON)."),
 ):
     """Interactive application, sensor and credentil manager."""
+    from .menu import _setup_credentials
+
     # Create a simple args-like object for backward compatibility
     class Args:
         def __init__(self):
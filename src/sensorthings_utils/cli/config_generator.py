@@ -1,6 +1,9 @@
 """Generate sensor configuration files from templates."""
 
 # standard
+import functools
+import itertools
+import re
 import yaml
 from pathlib import Path
 from typing import Any, Dict
@@ -14,97 +17,100 @@ from ..transformers.types import SupportedSensors
 
 console = Console()
 
+# Prefer the libyaml-backed C loader/dumper, falling back to pure Python.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+YAML_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+YAML_WRITE_BUFFER = 1 << 16
 
+# Matches any template placeholder token (e.g. "<SENSOR_ID>").
+PLACEHOLDER_RE = re.compile(
+    r"<(?:SENSOR_ID|THING_NAME|THING_DESCRIPTION|LOCATION_NAME|LOCATION_DESCRIPTION"
+    r"|LONGITUDE|LATITUDE)>"
+)
+
+# Known template locations per sensor model: directly under CONFIG_PATHS (for
+# backward compatibility), then in the subdirectory named after the model
+# prefix (e.g. "netatmo" for "netatmo.nws03").
+TEMPLATE_PATHS = {
+    model: (
+        CONFIG_PATHS / f"template_{model.value}.yaml",
+        CONFIG_PATHS / model.value.split(".")[0] / f"template_{model.value}.yaml",
+    )
+    for model in SupportedSensors
+}
+
+
+@functools.lru_cache(maxsize=8)
 def _load_template(sensor_model: SupportedSensors) -> Dict[str, Any]:
-    """Load template file for a sensor model."""
-    # Try direct path first (for backward compatibility)
-    template_path = CONFIG_PATHS / f"template_{sensor_model.value}.yaml"
-    
-    # If not found, search recursively in subdirectories
-    if not template_path.exists():
-        # Extract model prefix (e.g., "netatmo" from "netatmo.nws03")
-        model_prefix = sensor_model.value.split('.')[0]
-        # Try in subdirectory matching the model prefix
-        template_path = CONFIG_PATHS / model_prefix / f"template_{sensor_model.value}.yaml"
-        
-        # If still not found, search recursively for any template matching the pattern
-        if not template_path.exists():
-            pattern = f"template_{sensor_model.value}.yaml"
-            found_templates = list(CONFIG_PATHS.rglob(pattern))
-            if found_templates:
-                template_path = found_templates[0]
-            else:
-                raise FileNotFoundError(
-                    f"Template not found for {sensor_model.value}. "
-                    f"Searched in {CONFIG_PATHS} and subdirectories. "
-                    f"Expected pattern: template_{sensor_model.value}.yaml"
-                )
-    
-    with open(template_path, "r") as f:
-        template = yaml.safe_load(f)
-    return template
+    """Load template file for a sensor model.
 
+    The parsed template is cached per sensor model and shared between calls,
+    so callers must not mutate it. `_replace_placeholders` never edits it in
+    place, but its result shares unchanged subtrees with the template.
+    """
+    template_name = f"template_{sensor_model.value}.yaml"
+    # Try the known locations first, then search recursively for any
+    # template matching the pattern
+    candidates = itertools.chain(
+        TEMPLATE_PATHS[sensor_model], CONFIG_PATHS.rglob(template_name)
+    )
+    for template_path in candidates:
+        try:
+            # binary read: the C loader decodes the bytes itself
+            with open(template_path, "rb") as f:
+                return yaml.load(f, Loader=YAML_LOADER)
+        except FileNotFoundError:
+            continue
+    raise FileNotFoundError(
+        f"Template not found for {sensor_model.value}. "
+        f"Searched in {CONFIG_PATHS} and subdirectories. "
+        f"Expected pattern: {template_name}"
+    )
 
-def _replace_placeholders(
-    data: Any,
-    sensor_id: str,
-    thing_name: str,
-    thing_description: str,
-    location_name: str,
-    location_description: str,
-    longitude: float,
-    latitude: float,
-) -> Any:
-    """Recursively replace placeholders in data structure."""
+
+def _replace_placeholders(data: Any, substitutions: Dict[str, Any]) -> Any:
+    """Recursively replace placeholders in data structure.
+
+    A string that is exactly one placeholder takes the raw value, so numbers
+    stay numbers; unchanged subtrees are returned as-is, not copied.
+    """
     if isinstance(data, dict):
         result = {}
+        changed = False
         for key, value in data.items():
-            # Replace placeholder keys
-            new_key = key
-            if key == "<SENSOR_ID>":
-                new_key = sensor_id
-            elif key == "<THING_NAME>":
-                new_key = thing_name
-            elif key == "<LOCATION_NAME>":
-                new_key = location_name
-            
-            result[new_key] = _replace_placeholders(
-                value, sensor_id, thing_name, thing_description,
-                location_name, location_description, longitude, latitude
-            )
-        return result
+            new_key = _replace_placeholders(key, substitutions)
+            new_value = _replace_placeholders(value, substitutions)
+            changed = changed or new_key is not key or new_value is not value
+            result[new_key] = new_value
+        return result if changed else data
     elif isinstance(data, list):
-        result = []
-        for item in data:
-            # Handle coordinate placeholders in lists
-            if isinstance(item, str):
-                if item == "<LONGITUDE>":
-                    result.append(longitude)
-                elif item == "<LATITUDE>":
-                    result.append(latitude)
-                else:
-                    result.append(_replace_placeholders(
-                        item, sensor_id, thing_name, thing_description,
-                        location_name, location_description, longitude, latitude
-                    ))
-            else:
-                result.append(_replace_placeholders(
-                    item, sensor_id, thing_name, thing_description,
-                    location_name, location_description, longitude, latitude
-                ))
+        result = [_replace_placeholders(item, substitutions) for item in data]
+        if all(new is old for new, old in zip(result, data)):
+            return data
         return result
     elif isinstance(data, str):
-        # Replace placeholder values
-        data = data.replace("<SENSOR_ID>", sensor_id)
-        data = data.replace("<THING_NAME>", thing_name)
-        data = data.replace("<THING_DESCRIPTION>", thing_description)
-        data = data.replace("<LOCATION_NAME>", location_name)
-        data = data.replace("<LOCATION_DESCRIPTION>", location_description)
-        return data
+        if "<" not in data:
+            return data
+        value = substitutions.get(data)
+        if value is not None:
+            return value
+        return PLACEHOLDER_RE.sub(lambda m: str(substitutions[m.group(0)]), data)
     else:
         return data
 
 
+class _NoAliasDumper(YAML_DUMPER):
+    """Dumper that writes repeated objects out in full instead of as aliases.
+
+    Generated configs share unchanged subtrees with the cached template, and
+    the template's own anchors resolve to shared objects; neither should show
+    up as ``&id001`` anchors in the output file.
+    """
+
+    def ignore_aliases(self, data):
+        return True
+
+
 def generate_config_from_template(
     sensor_model: SupportedSensors,
     sensor_id: str,
@@ -137,38 +143,18 @@ def generate_config_from_template(
     
     # Replace placeholders
     config = _replace_placeholders(
-        template, sensor_id, thing_name, thing_description,
-        location_name, location_description, longitude, latitude
+        template,
+        {
+            "<SENSOR_ID>": sensor_id,
+            "<THING_NAME>": thing_name,
+            "<THING_DESCRIPTION>": thing_description,
+            "<LOCATION_NAME>": location_name,
+            "<LOCATION_DESCRIPTION>": location_description,
+            "<LONGITUDE>": longitude,
+            "<LATITUDE>": latitude,
+        },
     )
     
-    # Coordinates should already be replaced by _replace_placeholders, but ensure they're correct
-    if "locations" in config:
-        for loc_name, loc_data in config["locations"].items():
-            if "location" in loc_data and "coordinates" in loc_data["location"]:
-                coords = loc_data["location"]["coordinates"]
-                # Ensure coordinates are a list of numbers
-                if isinstance(coords, list) and len(coords) == 2:
-                    # Check if placeholders weren't replaced (shouldn't happen after _replace_placeholders)
-                    if any(isinstance(c, str) and ("<LONGITUDE>" in c or "<LATITUDE>" in c) for c in coords):
-                        loc_data["location"]["coordinates"] = [longitude, latitude]
-                elif not isinstance(coords, list) or len(coords) != 2:
-                    loc_data["location"]["coordinates"] = [longitude, latitude]
-    
-    # Also replace in datastream iot_links
-    if "datastreams" in config:
-        for ds_name, ds_data in config["datastreams"].items():
-            if "iot_links" in ds_data:
-                if "sensors" in ds_data["iot_links"]:
-                    ds_data["iot_links"]["sensors"] = [sensor_id]
-                if "things" in ds_data["iot_links"]:
-                    ds_data["iot_links"]["things"] = [thing_name]
-    
-    # Update sensor name in sensors section
-    if "sensors" in config:
-        sensor_key = sensor_model.value
-        if sensor_key in config["sensors"]:
-            config["sensors"][sensor_key]["name"] = sensor_id
-    
     # Determine output path
     if output_path is None:
         output_path = CONFIG_PATHS / f"{sensor_id}.yaml"
@@ -177,7 +163,14 @@ def generate_config_from_template(
     
     # Write output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    with open(output_path, "w", buffering=YAML_WRITE_BUFFER) as f:
+        yaml.dump(
+            config,
+            f,
+            Dumper=_NoAliasDumper,
+            default_flow_style=False,
+            sort_keys=False,
+            allow_unicode=True,
+        )
     
     return output_path
@@ -1,29 +1,84 @@
 """Credential setup functions."""
 
 # standard
+import functools
 import json
-import subprocess
+from pathlib import Path
 
 # external
 from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich import print as rprint
 from getpass import getpass
 
 # internal
-from ..paths import CREDENTIALS_DIR
-from .system_checks import _check_postgres_persistent_volume
+from ..paths import (
+    FROST_CREDENTIALS_FILE,
+    POSTGRES_CREDENTIALS_FILE,
+    MQTT_CREDENTIALS_FILE,
+    TOMCAT_USERS_FILE,
+    APPLICATION_CREDENTIALS_FILE,
+)
+from .files import _atomic_open, _write_in_place
+from .system_checks import (
+    _check_postgres_persistent_volume,
+    _docker_volume_created_at,
+    _invalidate_credentials_cache,
+)
 
 console = Console()
 
+# Opening of tomcat-users.xml, up to and including the root element
+TOMCAT_USERS_HEADER = '''<?xml version="1.0" encoding="UTF-8"?>
+<tomcat-users xmlns="http://tomcat.apache.org/xml"
+              xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
+              xsi:schemaLocation="http://tomcat.apache.org/xml
+              http://tomcat.apache.org/xml/tomcat-users.xsd"
+              version="1.0">
+'''
+
+
+def _print_header(title: str):
+    """Print the boxed section header shown at the top of each setup step."""
+    from rich.panel import Panel
+    
+    console.print(Panel.fit(f"[bold]{title}[/bold]", border_style="blue"))
+
+
+def _atomic_write_text(path: Path, text: str):
+    """
+    Write text to a credentials file atomically (see `_atomic_open`).
+
+    An interrupted write never leaves a truncated or empty credentials file
+    behind, and the file keeps its permission bits. Running containers see
+    the new content after a restart.
+    """
+    with _atomic_open(path) as f:
+        f.write(text)
+    _invalidate_credentials_cache()
+
+
+def _atomic_write_json(path: Path, data, compact: bool = False):
+    """
+    Write data to a JSON file atomically (see `_atomic_write_text`).
+
+    Args:
+        path: Target file
+        data: JSON-serializable data
+        compact: Write without whitespace, via the C encoder. Only for files
+            read by JSON parsers; postgres_credentials.json is parsed line by
+            line with awk and must stay indented.
+    """
+    if compact:
+        text = json.dumps(data, separators=(",", ":"))
+    else:
+        text = json.dumps(data, indent=4)
+    _atomic_write_text(path, text)
+
 
 def setup_frost_credentials():
     """Setup FROST credentials."""
-    console.print(Panel.fit(
-        "[bold]FROST Credentials[/bold]",
-        border_style="blue"
-    ))
+    from rich.prompt import Prompt
+    
+    _print_header("FROST Credentials")
     
     frost_username = Prompt.ask("FROST username", default="sta-admin")
     frost_password = getpass("FROST password: ")
@@ -33,39 +88,23 @@ def setup_frost_credentials():
         "frost_password": frost_password
     }
     
-    frost_file = CREDENTIALS_DIR / "frost_credentials.json"
-    if not frost_file.exists():
-        frost_file.touch()
-
-    with open(frost_file, "w") as f:
-        json.dump(frost_creds, f, indent=4)
+    frost_file = FROST_CREDENTIALS_FILE
+    _atomic_write_json(frost_file, frost_creds)
     console.print(f"[green]✓ Created/Updated {frost_file}[/green]")
     return True
 
 
 def _setup_postgres_credentials():
     """Setup PostgreSQL credentials."""
-    console.print(Panel.fit(
-        "[bold]PostgreSQL Credentials[/bold]",
-        border_style="blue"
-    ))
+    from rich.panel import Panel
+    from rich.prompt import Prompt, Confirm
+    
+    _print_header("PostgreSQL Credentials")
     
     # Check if persistent volume exists - CRITICAL WARNING
     has_persistent_volume = _check_postgres_persistent_volume()
     if has_persistent_volume:
-        created_at = subprocess.run(
-            [
-                "docker", 
-                "volume", 
-                "inspect", 
-                "st-utils-production_postgis_volume", 
-                "--format", 
-                "{{.CreatedAt}}"
-                ],
-            capture_output=True,
-            text=True,
-            timeout=5
-        ).stdout.strip()
+        created_at = _docker_volume_created_at("st-utils-production_postgis_volume")
         
         warning_text = (
             f"[bold red]🚨 CRITICAL WARNING:[/bold red] PostgreSQL production persistent volume "
@@ -85,7 +124,6 @@ def _setup_postgres_credentials():
         
         console.print(Panel(warning_text, border_style="red"))
         
-        from rich.prompt import Confirm
         response = Confirm.ask("\nContinue anyway? This may lock you out!", default=False)
         if not response:
             console.print("[yellow]Skipping PostgreSQL credentials setup.[/yellow]")
@@ -99,9 +137,8 @@ def _setup_postgres_credentials():
         "postgres_password": postgres_password
     }
     
-    postgres_file = CREDENTIALS_DIR / "postgres_credentials.json"
-    with open(postgres_file, "w") as f:
-        json.dump(postgres_creds, f, indent=4)
+    postgres_file = POSTGRES_CREDENTIALS_FILE
+    _atomic_write_json(postgres_file, postgres_creds)
     console.print(f"[green]✓ Created/Updated {postgres_file}[/green]")
     
     if has_persistent_volume:
@@ -114,10 +151,9 @@ def _setup_postgres_credentials():
 
 def _setup_mqtt_credentials():
     """Setup MQTT credentials."""
-    console.print(Panel.fit(
-        "[bold]MQTT Credentials[/bold]",
-        border_style="blue"
-    ))
+    from rich.prompt import Prompt
+    
+    _print_header("MQTT Credentials")
     
     mqtt_users = {}
     user_count = 0
@@ -173,9 +209,8 @@ def _setup_mqtt_credentials():
         }
     
     if mqtt_users:
-        mqtt_file = CREDENTIALS_DIR / "mqtt_credentials.json"
-        with open(mqtt_file, "w") as f:
-            json.dump(mqtt_users, f, indent=4)
+        mqtt_file = MQTT_CREDENTIALS_FILE
+        _atomic_write_json(mqtt_file, mqtt_users, compact=True)
         console.print(f"[green]✓ Created/Updated {mqtt_file}[/green]")
         return True
     return False
@@ -186,10 +221,9 @@ def _setup_tomcat_users():
     
     If no users are provided, the file will be deleted to allow public access.
     """
-    console.print(Panel.fit(
-        "[bold]Tomcat Users (Webapp Authentication)[/bold]",
-        border_style="blue"
-    ))
+    from rich.prompt import Prompt
+    
+    _print_header("Tomcat Users (Webapp Authentication)")
     console.print("[yellow]⚠️  Note:[/yellow] [bold]An empty file makes the app public (no authentication required).[/bold]")
     console.print("[dim]Leave username empty to skip adding users and allow public access.[/dim]")
     
@@ -213,24 +247,19 @@ def _setup_tomcat_users():
             "roles": roles
         })
     
-    tomcat_file = CREDENTIALS_DIR / "tomcat-users.xml"
+    tomcat_file = TOMCAT_USERS_FILE
     
     # Always create a valid XML file (empty if no users = public access)
-    xml_content = '''<?xml version="1.0" encoding="UTF-8"?>
-<tomcat-users xmlns="http://tomcat.apache.org/xml"
-              xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance"
-              xsi:schemaLocation="http://tomcat.apache.org/xml
-              http://tomcat.apache.org/xml/tomcat-users.xsd"
-              version="1.0">
-'''
-    if users:
-        for user in users:
-            xml_content += f'  <user username="{user["username"]}" password="{user["password"]}" roles="{user["roles"]}"/>\n'
+    user_lines = [
+        f'  <user username="{user["username"]}" password="{user["password"]}" roles="{user["roles"]}"/>\n'
+        for user in users
+    ]
     # If no users, file will be empty (just root element) = public access
-    xml_content += '</tomcat-users>\n'
+    xml_content = "".join([TOMCAT_USERS_HEADER, *user_lines, "</tomcat-users>\n"])
     
-    with open(tomcat_file, "w") as f:
-        f.write(xml_content)
+    # Tomcat bind-mounts this single file, so keep its inode
+    _write_in_place(tomcat_file, xml_content)
+    _invalidate_credentials_cache()
     
     if users:
         console.print(f"[green]✓ Created/Updated {tomcat_file}[/green]")
@@ -240,26 +269,43 @@ def _setup_tomcat_users():
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _load_app_creds(app_file: Path, mtime_ns: int) -> dict:
+    """Parse the application credentials file, cached on its mtime.
+
+    Callers must copy the result before modifying it.
+
+    Args:
+        app_file: Path to application_credentials.json
+        mtime_ns: Modification time of app_file, used only as the cache key
+
+    Returns:
+        The decoded credentials, or an empty dict if the file cannot be parsed
+    """
+    try:
+        with open(app_file, "r") as f:
+            return json.load(f)
+    except Exception:
+        return {}
+
+
 def _setup_application_credentials(app_name: str = None):
     """Setup application credentials.
     
     Args:
         app_name: Optional application name to pre-fill. If provided, only sets up this app.
     """
-    console.print(Panel.fit(
-        "[bold]Application Credentials[/bold]",
-        border_style="blue"
-    ))
+    from rich.prompt import Prompt
+    from .applications import _invalidate_application_status
+    
+    _print_header("Application Credentials")
     
     # Load existing credentials if file exists
-    app_file = CREDENTIALS_DIR / "application_credentials.json"
-    app_creds = {}
-    if app_file.exists():
-        try:
-            with open(app_file, "r") as f:
-                app_creds = json.load(f)
-        except Exception:
-            pass
+    app_file = APPLICATION_CREDENTIALS_FILE
+    try:
+        app_creds = dict(_load_app_creds(app_file, app_file.stat().st_mtime_ns))
+    except FileNotFoundError:
+        app_creds = {}
     
     if app_name:
         # Single app mode - pre-filled, just ask for api_key
@@ -268,8 +314,9 @@ def _setup_application_credentials(app_name: str = None):
         
         if api_key:
             app_creds[app_name] = {"api_key": api_key}
-            with open(app_file, "w") as f:
-                json.dump(app_creds, f, indent=4)
+            _atomic_write_json(app_file, app_creds, compact=True)
+            _load_app_creds.cache_clear()
+            _invalidate_application_status()
             console.print(f"[green]✓ Created/Updated {app_file}[/green]")
             return True
         return False
@@ -291,8 +338,9 @@ def _setup_application_credentials(app_name: str = None):
         
         if new_creds:
             app_creds.update(new_creds)
-            with open(app_file, "w") as f:
-                json.dump(app_creds, f, indent=4)
+            _atomic_write_json(app_file, app_creds, compact=True)
+            _load_app_creds.cache_clear()
+            _invalidate_application_status()
             console.print(f"[green]✓ Created/Updated {app_file}[/green]")
             return True
         return False
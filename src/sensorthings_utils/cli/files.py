@@ -0,0 +1,65 @@
+"""File writing helpers shared by the setup commands."""
+
+# standard
+import contextlib
+import os
+import stat
+from pathlib import Path
+
+
+@contextlib.contextmanager
+def _atomic_open(path: Path, buffering: int = -1):
+    """
+    Open a text file that atomically replaces `path` when the block exits.
+
+    Writes go to a temporary file next to the target, which is fsynced and
+    moved into place, so an interrupted write never leaves a truncated file
+    behind. The permission bits of an existing target are copied to the
+    replacement (a 0600 secret stays 0600); a new file gets the same mode a
+    plain open() would give it.
+
+    The replacement is a new inode, so a container that bind-mounts the
+    single file keeps seeing the old content until it is restarted. Use
+    `_write_in_place` for files that must keep their inode.
+
+    Args:
+        path: File to replace
+        buffering: Buffer size passed to open()
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        mode = stat.S_IMODE(path.stat().st_mode)
+    except FileNotFoundError:
+        mode = None
+
+    # Never write through a stale temporary file or a symlink left in its place
+    tmp_path.unlink(missing_ok=True)
+    try:
+        fd = os.open(
+            tmp_path,
+            os.O_WRONLY | os.O_CREAT | os.O_EXCL,
+            0o666 if mode is None else 0o600,
+        )
+        with open(fd, "w", buffering=buffering) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if mode is not None:
+            os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _write_in_place(path: Path, text: str):
+    """
+    Overwrite a file's content, keeping its inode, owner and mode.
+
+    Use for files that containers bind-mount individually, such as
+    tomcat-users.xml, where a replaced inode would not be seen.
+    """
+    with open(path, "w") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
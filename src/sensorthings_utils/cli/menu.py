@@ -1,54 +1,157 @@
 """Menu and orchestration functions."""
 
 # standard
-import json
+import functools
+import os
 
 # external
 from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
-from rich.prompt import Prompt, Confirm, IntPrompt
-from rich import print as rprint
 
 # internal
-from ..paths import CREDENTIALS_DIR, TOKENS_DIR
-from .system_checks import _check_existing_and_valid_credentials, _get_missing_mandatory, _check_containers_running, _is_first_time_setup
-from .credentials import (
-    setup_frost_credentials,
-    _setup_postgres_credentials,
-    _setup_mqtt_credentials,
-    _setup_tomcat_users,
-    _setup_application_credentials,
+from ..paths import (
+    CREDENTIALS_DIR,
+    FROST_CREDENTIALS_FILE,
+    POSTGRES_CREDENTIALS_FILE,
+    MQTT_CREDENTIALS_FILE,
+    TOMCAT_USERS_FILE,
+    APPLICATION_CREDENTIALS_FILE,
 )
-from .tokens import _setup_token_file, _manage_tokens
-from .applications import _get_application_status, _show_application_status, _add_application_to_config
-from .config_generator import generate_config_from_template
-from ..transformers.types import SupportedSensors
-from ..sensor_things.extensions import SensorConfig
+from .system_checks import _check_existing_and_valid_credentials, _ensure_credential_dirs, _get_missing_mandatory, _check_containers_running, _is_first_time_setup
+from .applications import _get_application_summary, _show_application_status, _add_application_to_config
 
 console = Console()
 
+# Credential file for each credential type shown in the setup menus
+CREDENTIAL_FILES = {
+    'frost': FROST_CREDENTIALS_FILE,
+    'postgres': POSTGRES_CREDENTIALS_FILE,
+    'mqtt': MQTT_CREDENTIALS_FILE,
+    'tomcat': TOMCAT_USERS_FILE,
+    'application': APPLICATION_CREDENTIALS_FILE,
+}
 
+# Name of the setup function in .credentials for each credential type
+CREDENTIAL_SETUPS = {
+    'frost': 'setup_frost_credentials',
+    'postgres': '_setup_postgres_credentials',
+    'mqtt': '_setup_mqtt_credentials',
+    'tomcat': '_setup_tomcat_users',
+    'application': '_setup_application_credentials',
+}
+
+# Credentials menu choice -> credential type
+CREDENTIAL_MENU_CHOICES = {
+    "1": 'frost',
+    "2": 'postgres',
+    "3": 'mqtt',
+    "4": 'tomcat',
+    "5": 'application',
+}
+
+# Accepted answers for each menu prompt
+MAIN_MENU_OPTIONS = ("1", "2", "3", "4", "5")
+CREDENTIALS_MENU_OPTIONS = ("1", "2", "3", "4", "5", "6", "7")
+NEXT_STEPS_OPTIONS = ("1", "2", "3")
+
+
+def _credential_setup(cred_type):
+    """Return the setup function for a credential type.
+    
+    The credentials module is imported on first use rather than when the
+    menu module loads.
+    
+    Args:
+        cred_type: Key into CREDENTIAL_SETUPS, e.g. 'frost'
+    
+    Returns:
+        The setup function; it returns True if it wrote the file
+    """
+    from . import credentials
+    return getattr(credentials, CREDENTIAL_SETUPS[cred_type])
+
+
+def _credential_files_exist():
+    """Return a mapping of credential type to whether its file exists.
+    
+    All credential files live in CREDENTIALS_DIR, so a single directory
+    listing answers every lookup instead of one stat per file.
+    """
+    try:
+        with os.scandir(CREDENTIALS_DIR) as entries:
+            present = {entry.name for entry in entries}
+    except FileNotFoundError:
+        present = set()
+    return {cred_type: path.name in present for cred_type, path in CREDENTIAL_FILES.items()}
+
+
+@functools.lru_cache(maxsize=32)
+def _menu_panel(title, border_style, rows):
+    """Build a menu panel from (key, label) rows, reused while the rows are unchanged.
+    
+    Args:
+        title: Panel title markup
+        border_style: Panel border style
+        rows: Tuple of (key markup, label markup) pairs
+    
+    Returns:
+        A fitted Panel wrapping a borderless two-column table
+    """
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+    
+    # Parse the markup here so redraws of the cached panel skip it
+    menu_table = Table(show_header=False, box=None, padding=(0, 2))
+    for key, label in rows:
+        menu_table.add_row(Text.from_markup(key), Text.from_markup(label))
+    return Panel.fit(menu_table, title=Text.from_markup(title), border_style=border_style)
+
+
+def _print_options(title, labels):
+    """Print a numbered option list, followed by a back option, in one write.
+    
+    Args:
+        title: Heading shown above the options
+        labels: Option labels, numbered from 1
+    """
+    lines = [f"\n[bold]{title}[/bold]"]
+    lines.extend(f"  [cyan][{i}][/cyan] {label}" for i, label in enumerate(labels, 1))
+    lines.append(f"  [cyan][{len(labels) + 1}][/cyan] Back to main menu")
+    console.print("\n".join(lines))
+
+
+@functools.lru_cache(maxsize=1)
 def _get_sensors_by_brand():
     """Organize supported sensors by brand.
     
+    The mapping is static, so it is built once and shared; callers must
+    not modify it.
+    
     Returns:
-        dict: Mapping of brand names to lists of (model_name, SupportedSensors enum) tuples
+        dict: Mapping of brand names to tuples of (model_name, SupportedSensors enum) pairs
     """
+    from ..transformers.types import SupportedSensors
+    
     sensors_by_brand = {
-        "Milesight": [
+        "Milesight": (
             ("AM103L", SupportedSensors.MILESIGHT_AM103L),
             ("AM308L", SupportedSensors.MILESIGHT_AM308L),
-        ],
-        "Netatmo": [
+        ),
+        "Netatmo": (
             ("NWS03", SupportedSensors.NETATMO_NWS03),
-        ],
+        ),
     }
     return sensors_by_brand
 
 
 def _setup_sensor_configuration():
     """Interactive setup for sensor configuration generation."""
+    from rich.panel import Panel
+    from rich.prompt import Prompt, IntPrompt
+    from rich.table import Table
+    from .config_generator import generate_config_from_template
+    from ..sensor_things.extensions import SensorConfig
+    
     try:
         console.print(Panel.fit(
             "[bold blue]Setup Sensor Configuration[/bold blue]",
@@ -57,12 +160,9 @@ def _setup_sensor_configuration():
         
         # Step 1: Select brand
         sensors_by_brand = _get_sensors_by_brand()
-        brands = list(sensors_by_brand.keys())
+        brands = tuple(sensors_by_brand)
         
-        console.print("\n[bold]Select sensor brand:[/bold]")
-        for i, brand in enumerate(brands, 1):
-            console.print(f"  [cyan][{i}][/cyan] {brand}")
-        console.print(f"  [cyan][{len(brands) + 1}][/cyan] Back to main menu")
+        _print_options("Select sensor brand:", brands)
         
         brand_choice = IntPrompt.ask(
             f"\nSelect a brand",
@@ -85,10 +185,7 @@ def _setup_sensor_configuration():
         
         # Step 2: Select model within brand
         models = sensors_by_brand[selected_brand]
-        console.print(f"\n[bold]Select {selected_brand} sensor model:[/bold]")
-        for i, (model_name, _) in enumerate(models, 1):
-            console.print(f"  [cyan][{i}][/cyan] {model_name}")
-        console.print(f"  [cyan][{len(models) + 1}][/cyan] Back to main menu")
+        _print_options(f"Select {selected_brand} sensor model:", [model_name for model_name, _ in models])
         
         model_choice = IntPrompt.ask(
             f"\nSelect a model",
@@ -176,7 +273,7 @@ def _setup_sensor_configuration():
                     border_style="green"
                 ))
                 
-                next_choice = Prompt.ask("\nSelect an option", default="3", choices=["1", "2", "3"])
+                next_choice = Prompt.ask("\nSelect an option", default="3", choices=NEXT_STEPS_OPTIONS)
                 
                 if next_choice == "1":
                     console.print(f"\n[dim]Configuration file location: {output_path}[/dim]")
@@ -218,109 +315,122 @@ def _setup_sensor_configuration():
         return
 
 
+def _validation_error_text(heading, failures, label="{} credentials"):
+    """Build the panel text listing credential files that failed validation.
+    
+    Args:
+        heading: First line of the panel
+        failures: List of (cred_type, errors) pairs
+        label: Format string for each file's line, given the upper-cased type
+    
+    Returns:
+        The panel text, built with a single join
+    """
+    lines = [heading, ""]
+    for cred_type, errors in failures:
+        lines.append(f"[red]❌ {label.format(cred_type.upper())}:[/red]")
+        lines.extend(f"   {error}" for error in errors)
+    lines.append("")
+    return "\n".join(lines)
+
+
+def _collect_invalid(validation_results, cred_types=None):
+    """Find credential files that exist but failed validation.
+    
+    The credentials directory is only listed when some result failed.
+    
+    Args:
+        validation_results: Mapping of credential type to (is_valid, errors)
+        cred_types: Optional credential types to restrict the check to
+    
+    Returns:
+        List of (cred_type, errors) pairs
+    """
+    failed = [
+        (cred_type, errors)
+        for cred_type, (is_valid, errors) in validation_results.items()
+        if not is_valid and (cred_types is None or cred_type in cred_types)
+    ]
+    if not failed:
+        return failed
+    files_exist = _credential_files_exist()
+    return [(cred_type, errors) for cred_type, errors in failed if files_exist.get(cred_type, False)]
+
+
+def _run_credential_setup(existing, cred_type):
+    """Run the setup for one credential type and refresh the existing state.
+    
+    Args:
+        existing: Current existing state from `_check_existing_and_valid_credentials`
+        cred_type: Key into CREDENTIAL_SETUPS, e.g. 'frost'
+    
+    Returns:
+        The refreshed existing state, or `existing` unchanged if the setup
+        was skipped
+    """
+    if not _credential_setup(cred_type)():
+        return existing
+    
+    # Re-validate after update
+    existing, validation_results = _check_existing_and_valid_credentials()
+    if cred_type not in validation_results:
+        # No structural validation for this file; existence is enough
+        existing[cred_type] = CREDENTIAL_FILES[cred_type].exists()
+    elif validation_results[cred_type][0]:
+        existing[cred_type] = True
+    else:
+        console.print("[yellow]⚠️  Warning:[/yellow] File created but validation failed. Please check the file structure.")
+    return existing
+
+
 def _manage_credentials_and_tokens(existing):
-    """Unified menu for managing all credentials and tokens."""
+    """Unified menu for managing all credentials and tokens.
+    
+    Returns:
+        The existing-credentials state, refreshed after every change made here
+    """
+    from rich.prompt import Prompt
+    
     while True:
         try:
             # Get application status for display
-            app_status = _get_application_status()
+            configured, total = _get_application_summary()
             app_status_text = ""
-            if app_status:
-                total = len(app_status)
-                configured = sum(1 for s in app_status.values() if s["configured"])
+            if total:
                 app_status_text = f" [dim]({configured} of {total} configured)[/dim]"
             
             # Get token count
             token_count = len(existing['tokens']) if existing.get('tokens') else 0
             token_text = f" [dim]({token_count} existing)[/dim]" if token_count > 0 else ""
             
-            # Create menu table
-            menu_table = Table(show_header=False, box=None, padding=(0, 2))
-            menu_table.add_row("[cyan][1][/cyan]", f"FROST credentials{' [green]✓[/green]' if existing.get('frost') else ''}")
-            menu_table.add_row("[cyan][2][/cyan]", f"PostgreSQL credentials{' [green]✓[/green]' if existing.get('postgres') else ''}")
-            menu_table.add_row("[cyan][3][/cyan]", f"MQTT credentials{' [green]✓[/green]' if existing.get('mqtt') else ''}")
-            menu_table.add_row("[cyan][4][/cyan]", f"Tomcat users{' [green]✓[/green]' if existing.get('tomcat') else ''}")
-            menu_table.add_row("[cyan][5][/cyan]", f"Application credentials{app_status_text}")
-            if token_count > 0:
-                menu_table.add_row("[cyan][6][/cyan]", f"Manage token files{token_text}")
-            else:
-                menu_table.add_row("[cyan][6][/cyan]", "Add new token file")
-            menu_table.add_row("[cyan][7][/cyan]", "Back to main menu")
-            
-            console.print(Panel.fit(
-                menu_table,
-                title="[bold]Manage Credentials and Tokens[/bold]",
-                border_style="blue"
-            ))
+            # Create menu panel
+            menu_rows = (
+                ("[cyan][1][/cyan]", f"FROST credentials{' [green]✓[/green]' if existing.get('frost') else ''}"),
+                ("[cyan][2][/cyan]", f"PostgreSQL credentials{' [green]✓[/green]' if existing.get('postgres') else ''}"),
+                ("[cyan][3][/cyan]", f"MQTT credentials{' [green]✓[/green]' if existing.get('mqtt') else ''}"),
+                ("[cyan][4][/cyan]", f"Tomcat users{' [green]✓[/green]' if existing.get('tomcat') else ''}"),
+                ("[cyan][5][/cyan]", f"Application credentials{app_status_text}"),
+                ("[cyan][6][/cyan]", f"Manage token files{token_text}" if token_count > 0 else "Add new token file"),
+                ("[cyan][7][/cyan]", "Back to main menu"),
+            )
+            console.print(_menu_panel("[bold]Manage Credentials and Tokens[/bold]", "blue", menu_rows))
             
-            choice = Prompt.ask("\nSelect an option", default="7", choices=["1", "2", "3", "4", "5", "6", "7"])
+            choice = Prompt.ask("\nSelect an option", default="7", choices=CREDENTIALS_MENU_OPTIONS)
             
-            if choice == "1":
+            if choice in CREDENTIAL_MENU_CHOICES:
                 try:
-                    setup_frost_credentials()
-                    # Re-validate after update
-                    existing = _check_existing_and_valid_credentials()
-                    validation_results = existing.pop('_validation_results', {})
-                    if validation_results.get('frost', (False, []))[0]:
-                        existing['frost'] = True
-                    else:
-                        console.print("[yellow]⚠️  Warning:[/yellow] File created but validation failed. Please check the file structure.")
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
-            elif choice == "2":
-                try:
-                    if _setup_postgres_credentials():
-                        # Re-validate after update
-                        existing = _check_existing_and_valid_credentials()
-                        validation_results = existing.pop('_validation_results', {})
-                        if validation_results.get('postgres', (False, []))[0]:
-                            existing['postgres'] = True
-                        else:
-                            console.print("[yellow]⚠️  Warning:[/yellow] File created but validation failed. Please check the file structure.")
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
-            elif choice == "3":
-                try:
-                    if _setup_mqtt_credentials():
-                        # Re-validate after update
-                        existing = _check_existing_and_valid_credentials()
-                        validation_results = existing.pop('_validation_results', {})
-                        if validation_results.get('mqtt', (False, []))[0]:
-                            existing['mqtt'] = True
-                        else:
-                            console.print("[yellow]⚠️  Warning:[/yellow] File created but validation failed. Please check the file structure.")
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
-            elif choice == "4":
-                try:
-                    if _setup_tomcat_users():
-                        # Re-check after update
-                        existing = _check_existing_and_valid_credentials()
-                        existing['tomcat'] = (CREDENTIALS_DIR / "tomcat-users.xml").exists()
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
-            elif choice == "5":
-                try:
-                    if _setup_application_credentials():
-                        # Re-validate after update
-                        existing = _check_existing_and_valid_credentials()
-                        validation_results = existing.pop('_validation_results', {})
-                        if validation_results.get('application', (False, []))[0]:
-                            existing['application'] = True
-                        else:
-                            console.print("[yellow]⚠️  Warning:[/yellow] File created but validation failed. Please check the file structure.")
+                    existing = _run_credential_setup(existing, CREDENTIAL_MENU_CHOICES[choice])
                 except KeyboardInterrupt:
                     console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
             elif choice == "6":
+                from .tokens import _setup_token_file, _manage_tokens
                 try:
                     if token_count > 0:
                         _manage_tokens(existing['tokens'])
-                        existing = _check_existing_and_valid_credentials()  # Refresh token list
-                        existing.pop('_validation_results', None)  # Remove validation results
+                        existing, _ = _check_existing_and_valid_credentials()  # Refresh token list
                     else:
                         if _setup_token_file():
-                            existing = _check_existing_and_valid_credentials()  # Refresh token list
-                            existing.pop('_validation_results', None)  # Remove validation results
+                            existing, _ = _check_existing_and_valid_credentials()  # Refresh token list
                 except KeyboardInterrupt:
                     console.print("\n\n[yellow]Returning to credentials menu...[/yellow]")
             elif choice == "7":
@@ -330,89 +440,116 @@ def _manage_credentials_and_tokens(existing):
         except KeyboardInterrupt:
             console.print("\n\n[yellow]Returning to main menu...[/yellow]")
             break
+    return existing
+
+
+def _add_application(existing):
+    """Main menu [1]: add an application and set up its credentials or token.
+    
+    Returns:
+        The existing-credentials state, refreshed if a file was written
+    """
+    success, app_name, auth_type = _add_application_to_config()
+    if success and app_name and auth_type:
+        console.print(
+            f"\n[bold green]Application '{app_name}' added successfully![/bold green]\n"
+            "[dim]Setting up credentials/tokens for this application...[/dim]\n"
+        )
+        if auth_type == "credentials":
+            from .credentials import _setup_application_credentials
+            changed = _setup_application_credentials(app_name=app_name)
+        elif auth_type == "tokens":
+            from .tokens import _setup_token_file
+            changed = _setup_token_file(token_name=app_name)
+        else:
+            changed = False
+        # Refresh existing state only if setup wrote a file
+        if changed:
+            existing, _ = _check_existing_and_valid_credentials()
+    return existing
+
+
+def _configure_sensor(existing):
+    """Main menu [2]: run the sensor configuration wizard."""
+    _setup_sensor_configuration()
+    return existing
+
+
+def _view_applications(existing):
+    """Main menu [3]: show the configured applications."""
+    from rich.prompt import Prompt
+    
+    _show_application_status()
+    Prompt.ask("\nPress Enter to continue", default="")
+    return existing
+
+
+# Main menu choice -> action; each takes and returns the existing state.
+# The credentials menu refreshes the state after each change it makes.
+MAIN_MENU_ACTIONS = {
+    "1": _add_application,
+    "2": _configure_sensor,
+    "3": _view_applications,
+    "4": _manage_credentials_and_tokens,
+}
 
 
 def _show_main_menu(existing):
     """Show main menu and handle selections."""
+    from rich.prompt import Prompt
+    
     while True:
         try:
             # Get application status for summary
-            app_status = _get_application_status()
+            configured, total = _get_application_summary()
             app_summary = ""
-            if app_status:
-                total = len(app_status)
-                configured = sum(1 for s in app_status.values() if s["configured"])
+            if total:
                 app_summary = f" [dim]({configured}/{total} configured)[/dim]"
             
-            # Create menu table
-            menu_table = Table(show_header=False, box=None, padding=(0, 2))
-            menu_table.add_row("[red][1][/red]", "Setup sensor application")
-            menu_table.add_row("[red][2][/red]", "Setup a sensor configuration")
-            menu_table.add_row("[red][3][/red]", f"Manage configured applications{app_summary}")
-            menu_table.add_row("[red][4][/red]", "Manage existing credentials and tokens")
-            menu_table.add_row("[red][5][/red]", "Exit")
-            
-            console.print(Panel.fit(
-                menu_table,
-                title="[bold]Main Menu[/bold]",
-                border_style="green"
-            ))
+            # Create menu panel
+            menu_rows = (
+                ("[red][1][/red]", "Setup sensor application"),
+                ("[red][2][/red]", "Setup a sensor configuration"),
+                ("[red][3][/red]", f"Manage configured applications{app_summary}"),
+                ("[red][4][/red]", "Manage existing credentials and tokens"),
+                ("[red][5][/red]", "Exit"),
+            )
+            console.print(_menu_panel("[bold]Main Menu[/bold]", "green", menu_rows))
             
-            choice = Prompt.ask("\nSelect an option", default="5", choices=["1", "2", "3", "4", "5"])
+            choice = Prompt.ask("\nSelect an option", default="5", choices=MAIN_MENU_OPTIONS)
             
-            if choice == "1":
-                try:
-                    success, app_name, auth_type = _add_application_to_config()
-                    if success and app_name and auth_type:
-                        console.print(f"\n[bold green]Application '{app_name}' added successfully![/bold green]")
-                        console.print("[dim]Setting up credentials/tokens for this application...[/dim]\n")
-                        if auth_type == "credentials":
-                            _setup_application_credentials(app_name=app_name)
-                        elif auth_type == "tokens":
-                            _setup_token_file(token_name=app_name)
-                        # Refresh existing state after setup
-                        existing = _check_existing_and_valid_credentials()
-                        existing.pop('_validation_results', None)
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to main menu...[/yellow]")
-            elif choice == "2":
-                try:
-                    _setup_sensor_configuration()
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to main menu...[/yellow]")
-            elif choice == "3":
-                try:
-                    _show_application_status()
-                    Prompt.ask("\nPress Enter to continue", default="")
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to main menu...[/yellow]")
-            elif choice == "4":
-                try:
-                    _manage_credentials_and_tokens(existing)
-                    # Refresh existing state after returning from management
-                    existing = _check_existing_and_valid_credentials()
-                    existing.pop('_validation_results', None)
-                except KeyboardInterrupt:
-                    console.print("\n\n[yellow]Returning to main menu...[/yellow]")
-            elif choice == "5":
+            if choice == "5":
                 console.print("\n[yellow]Exiting setup.[/yellow]")
                 break
+            
+            try:
+                existing = MAIN_MENU_ACTIONS[choice](existing)
+            except KeyboardInterrupt:
+                console.print("\n\n[yellow]Returning to main menu...[/yellow]")
         except KeyboardInterrupt:
             console.print("\n\n[yellow]Returning to main menu...[/yellow]")
             continue
+        except EOFError:
+            # stdin closed (piped or scripted session): treat as Exit
+            console.print("\n[yellow]Exiting setup.[/yellow]")
+            break
 
 
 def _setup_credentials(args):
     """Interactive setup for credential files with menu system."""
-    CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
-    TOKENS_DIR.mkdir(parents=True, exist_ok=True)
+    from rich.panel import Panel
+    from rich.prompt import Confirm
+    from rich.table import Table
+    
+    _ensure_credential_dirs()
     
     # Create empty application_credentials.json if it doesn't exist
     # This is required for docker-compose file mounts
-    app_creds_file = CREDENTIALS_DIR / "application_credentials.json"
-    if not app_creds_file.exists():
-        with open(app_creds_file, "w") as f:
-            json.dump({}, f, indent=4)
+    try:
+        with open(APPLICATION_CREDENTIALS_FILE, "x") as f:
+            f.write("{}")
+    except FileExistsError:
+        pass
     
     console.print(Panel.fit(
         "[bold]SensorThings Utils Credential Setup[/bold]",
@@ -430,8 +567,7 @@ def _setup_credentials(args):
         ))
     
     # Check existing credentials and validate them
-    existing = _check_existing_and_valid_credentials()
-    validation_results = existing.pop('_validation_results', {})
+    existing, validation_results = _check_existing_and_valid_credentials()
     
     # Check if this is first-time setup
     is_first_time = _is_first_time_setup(existing)
@@ -444,25 +580,15 @@ def _setup_credentials(args):
         ))
     
     # Check for invalid credential files and prompt user to fix them
-    invalid_files = []
-    for cred_type, (is_valid, errors) in validation_results.items():
-        file_exists = {
-            'frost': (CREDENTIALS_DIR / "frost_credentials.json").exists(),
-            'postgres': (CREDENTIALS_DIR / "postgres_credentials.json").exists(),
-            'mqtt': (CREDENTIALS_DIR / "mqtt_credentials.json").exists(),
-            'tomcat': (CREDENTIALS_DIR / "tomcat-users.xml").exists(),
-            'application': (CREDENTIALS_DIR / "application_credentials.json").exists(),
-        }.get(cred_type, False)
-        
-        if file_exists and not is_valid:
-            invalid_files.append((cred_type, errors))
+    # (nothing was validated on first-time setup, so there is nothing to fix)
+    invalid_files = [] if is_first_time else _collect_invalid(validation_results)
     
     if invalid_files:
-        error_text = "[bold red]WARNING: Some credential files have validation errors![/bold red]\n\n"
-        for cred_type, errors in invalid_files:
-            error_text += f"[red]❌ Invalid {cred_type.upper()} credentials:[/red]\n"
-            for error in errors:
-                error_text += f"   {error}\n"
+        error_text = _validation_error_text(
+            "[bold red]WARNING: Some credential files have validation errors![/bold red]",
+            invalid_files,
+            label="Invalid {} credentials",
+        )
         
         console.print(Panel(error_text, border_style="red"))
         
@@ -476,51 +602,38 @@ def _setup_credentials(args):
             console.print("\n[bold]Fixing invalid credential files...[/bold]\n")
             for cred_type, _ in invalid_files:
                 try:
-                    if cred_type == 'frost':
-                        setup_frost_credentials()
-                        existing['frost'] = True
-                    elif cred_type == 'postgres':
-                        if _setup_postgres_credentials():
-                            existing['postgres'] = True
-                    elif cred_type == 'mqtt':
-                        if _setup_mqtt_credentials():
-                            existing['mqtt'] = True
-                    elif cred_type == 'tomcat':
-                        if _setup_tomcat_users():
-                            existing['tomcat'] = True
-                    elif cred_type == 'application':
-                        if _setup_application_credentials():
-                            existing['application'] = True
+                    if _credential_setup(cred_type)():
+                        existing[cred_type] = True
                 except KeyboardInterrupt:
                     console.print("\n\n[yellow]Cancelled fixing invalid files. Starting main menu...[/yellow]")
                     break
             
             # Re-validate after fixing
-            existing = _check_existing_and_valid_credentials()
-            validation_results = existing.pop('_validation_results', {})
+            existing, validation_results = _check_existing_and_valid_credentials()
             console.print("\n[green]✓ Validation complete. Re-checking files...[/green]")
             
             # Check if any files are still invalid
-            still_invalid = [
-                cred_type for cred_type, (is_valid, _) in validation_results.items()
-                if not is_valid and {
-                    'frost': (CREDENTIALS_DIR / "frost_credentials.json").exists(),
-                    'postgres': (CREDENTIALS_DIR / "postgres_credentials.json").exists(),
-                    'mqtt': (CREDENTIALS_DIR / "mqtt_credentials.json").exists(),
-                    'tomcat': (CREDENTIALS_DIR / "tomcat-users.xml").exists(),
-                    'application': (CREDENTIALS_DIR / "application_credentials.json").exists(),
-                }.get(cred_type, False)
-            ]
+            still_invalid = [cred_type for cred_type, _ in _collect_invalid(validation_results)]
             
             if still_invalid:
-                console.print(f"[yellow]⚠️  Warning:[/yellow] Some files are still invalid: {', '.join(still_invalid)}")
-                console.print("   You may need to fix them manually or try again.")
+                console.print(
+                    f"[yellow]⚠️  Warning:[/yellow] Some files are still invalid: {', '.join(still_invalid)}\n"
+                    "   You may need to fix them manually or try again."
+                )
         else:
             console.print("[yellow]Skipping validation fixes. You can fix them later from the main menu.[/yellow]")
     
     # Handle legacy command-line flags (for backward compatibility)
     if any([args.all, args.frost, args.postgres, args.mqtt, args.tomcat, args.token]):
         # Legacy mode: use flags
+        from .credentials import (
+            setup_frost_credentials,
+            _setup_postgres_credentials,
+            _setup_mqtt_credentials,
+            _setup_tomcat_users,
+        )
+        from .tokens import _setup_token_file
+        
         if args.frost or args.all:
             setup_frost_credentials()
         if args.postgres or args.all:
@@ -534,8 +647,8 @@ def _setup_credentials(args):
         
         # Validate all created/updated files
         console.print("\n[bold]Validating credential files...[/bold]\n")
-        from ..preflight.validation import validate_all_credentials
-        validation_results = validate_all_credentials(CREDENTIALS_DIR)
+        # Files that were not rewritten keep their cached validation result
+        _, validation_results = _check_existing_and_valid_credentials()
         
         all_valid = True
         validation_table = Table(title="Validation Results", show_header=True, header_style="bold")
@@ -543,14 +656,9 @@ def _setup_credentials(args):
         validation_table.add_column("Status", style="magenta")
         validation_table.add_column("Errors", style="red")
         
+        files_exist = _credential_files_exist()
         for cred_type, (is_valid, errors) in validation_results.items():
-            file_exists = {
-                'frost': (CREDENTIALS_DIR / "frost_credentials.json").exists(),
-                'postgres': (CREDENTIALS_DIR / "postgres_credentials.json").exists(),
-                'mqtt': (CREDENTIALS_DIR / "mqtt_credentials.json").exists(),
-                'tomcat': (CREDENTIALS_DIR / "tomcat-users.xml").exists(),
-                'application': (CREDENTIALS_DIR / "application_credentials.json").exists(),
-            }.get(cred_type, False)
+            file_exists = files_exist.get(cred_type, False)
             
             if file_exists:
                 if is_valid:
@@ -565,8 +673,10 @@ def _setup_credentials(args):
         if all_valid:
             console.print("\n[bold green]Setup complete! All credential files are valid.[/bold green]")
         else:
-            console.print("\n[bold yellow]Setup complete, but some files have validation errors.[/bold yellow]")
-            console.print("Please fix the errors above or run 'stu setup' again to fix them.")
+            console.print(
+                "\n[bold yellow]Setup complete, but some files have validation errors.[/bold yellow]\n"
+                "Please fix the errors above or run 'stu setup' again to fix them."
+            )
         return
     
     # New interactive menu mode
@@ -574,75 +684,50 @@ def _setup_credentials(args):
     missing = _get_missing_mandatory(existing)
     
     if missing:
-        console.print(f"\n[yellow]⚠️  Missing mandatory credentials:[/yellow] {', '.join(missing)}")
-        console.print("[dim]Setting up missing mandatory credentials first...[/dim]\n")
+        console.print(
+            f"\n[yellow]⚠️  Missing mandatory credentials:[/yellow] {', '.join(missing)}\n"
+            "[dim]Setting up missing mandatory credentials first...[/dim]\n"
+        )
         
         try:
             for cred_type in missing:
-                if cred_type == 'frost':
-                    setup_frost_credentials()
-                elif cred_type == 'postgres':
-                    _setup_postgres_credentials()
-                elif cred_type == 'mqtt':
-                    _setup_mqtt_credentials()
-                elif cred_type == 'tomcat':
-                    _setup_tomcat_users()
+                _credential_setup(cred_type)()
         except KeyboardInterrupt:
             console.print("\n\n[yellow]Cancelled setup. Starting main menu...[/yellow]")
         
         # Re-validate after creating missing credentials
-        existing = _check_existing_and_valid_credentials()
-        validation_results = existing.pop('_validation_results', {})
+        existing, validation_results = _check_existing_and_valid_credentials()
         
         # Check if any created files are invalid
-        invalid_created = []
-        for cred_type in missing:
-            if cred_type in validation_results:
-                is_valid, errors = validation_results[cred_type]
-                file_exists = {
-                    'frost': (CREDENTIALS_DIR / "frost_credentials.json").exists(),
-                    'postgres': (CREDENTIALS_DIR / "postgres_credentials.json").exists(),
-                    'mqtt': (CREDENTIALS_DIR / "mqtt_credentials.json").exists(),
-                    'tomcat': (CREDENTIALS_DIR / "tomcat-users.xml").exists(),
-                }.get(cred_type, False)
-                
-                if file_exists:
-                    if is_valid:
-                        existing[cred_type] = True
-                    else:
-                        invalid_created.append((cred_type, errors))
+        invalid_created = _collect_invalid(validation_results, cred_types=missing)
         
         if invalid_created:
-            error_text = "[bold yellow]Warning: Some credential files were created but have validation errors:[/bold yellow]\n\n"
-            for cred_type, errors in invalid_created:
-                error_text += f"[red]❌ {cred_type.upper()} credentials:[/red]\n"
-                for error in errors:
-                    error_text += f"   {error}\n"
+            error_text = _validation_error_text(
+                "[bold yellow]Warning: Some credential files were created but have validation errors:[/bold yellow]",
+                invalid_created,
+            )
             console.print(Panel(error_text, border_style="yellow"))
             console.print("\nYou can fix these from the main menu.")
     
     # Step 1.5: Prompt for Tomcat setup on first-time setup if not configured
     if is_first_time:
-        tomcat_file = CREDENTIALS_DIR / "tomcat-users.xml"
-        # Check if tomcat file is empty (just default structure with no users)
-        is_tomcat_empty = False
-        if tomcat_file.exists():
-            try:
-                with open(tomcat_file, "r") as f:
-                    content = f.read()
-                    # Check if it's just the default empty structure (no <user> elements)
-                    if "<user " not in content and '<user username=' not in content:
-                        is_tomcat_empty = True
-            except Exception:
-                is_tomcat_empty = True
+        # Prompt when the file is missing, unreadable or only has the
+        # default empty structure (no <user> elements)
+        try:
+            with open(TOMCAT_USERS_FILE, "r") as f:
+                has_users = "<user " in f.read()
+        except Exception:
+            has_users = False
         
-        if is_tomcat_empty or not tomcat_file.exists():
-            console.print("\n[bold cyan]Tomcat Webapp Authentication Setup[/bold cyan]")
-            console.print("[yellow]⚠️  Note:[/yellow] [bold]An empty file makes the app public (no authentication required).[/bold]")
-            console.print("[dim]Configure authentication for the web application (optional - leave empty for public access)[/dim]\n")
+        if not has_users:
+            console.print(
+                "\n[bold cyan]Tomcat Webapp Authentication Setup[/bold cyan]\n"
+                "[yellow]⚠️  Note:[/yellow] [bold]An empty file makes the app public (no authentication required).[/bold]\n"
+                "[dim]Configure authentication for the web application (optional - leave empty for public access)[/dim]\n"
+            )
             try:
-                if _setup_tomcat_users():
-                    existing['tomcat'] = (CREDENTIALS_DIR / "tomcat-users.xml").exists()
+                if _credential_setup('tomcat')():
+                    existing['tomcat'] = True
             except KeyboardInterrupt:
                 console.print("\n[yellow]Skipping Tomcat setup. You can configure it later from the main menu.[/yellow]")
     
@@ -1,21 +1,65 @@
 """System state checking functions."""
 
 # standard
+import functools
+import os
 import subprocess
+import time
 from pathlib import Path
 
 # external
 from rich.console import Console
 
 # internal
-from ..paths import CREDENTIALS_DIR, TOKENS_DIR
-from ..preflight.validation import validate_all_credentials
+from ..paths import (
+    CREDENTIALS_DIR,
+    TOKENS_DIR,
+    FROST_CREDENTIALS_FILE,
+    POSTGRES_CREDENTIALS_FILE,
+    MQTT_CREDENTIALS_FILE,
+    TOMCAT_USERS_FILE,
+)
+from ..preflight.validation import (
+    validate_frost_credentials,
+    validate_postgres_credentials,
+    validate_mqtt_credentials,
+)
 
 console = Console()
 
+# Seconds a `docker compose ps` result is reused before asking docker again
+CONTAINERS_CHECK_TTL = 30
+
+# Validation result recorded for files that were not validated
+NOT_VALIDATED = (False, ())
+
+# Credential types that must be configured before the stack can run
+MANDATORY_CREDENTIALS = ('frost', 'postgres', 'mqtt')
+
+# File and validator for each credential type with structural validation
+CREDENTIAL_VALIDATORS = {
+    'frost': (FROST_CREDENTIALS_FILE, validate_frost_credentials),
+    'postgres': (POSTGRES_CREDENTIALS_FILE, validate_postgres_credentials),
+    'mqtt': (MQTT_CREDENTIALS_FILE, validate_mqtt_credentials),
+}
+
+_credentials_cache = {"key": None, "value": None}
+# cred_type -> (file signature, validation result)
+_file_validation_cache = {}
+_containers_cache = {"checked_at": None, "value": None}
+
 
 def _check_containers_running():
-    """Check if any containers are currently running."""
+    """Check if any containers are currently running.
+    
+    The result is reused for CONTAINERS_CHECK_TTL seconds so repeated
+    checks in one session do not each spawn `docker compose ps`.
+    """
+    now = time.monotonic()
+    checked_at = _containers_cache["checked_at"]
+    if checked_at is not None and now - checked_at < CONTAINERS_CHECK_TTL:
+        return _containers_cache["value"]
+    
     try:
         result = subprocess.run(
             ['docker', 'compose', 'ps', '-q'],
@@ -23,9 +67,11 @@ def _check_containers_running():
             text=True,
             timeout=5
         )
-        return bool(result.stdout.strip())
+        running = bool(result.stdout.strip())
     except (subprocess.TimeoutExpired, FileNotFoundError, subprocess.SubprocessError):
-        return False
+        running = False
+    _containers_cache.update(checked_at=now, value=running)
+    return running
 
 
 def _check_postgres_persistent_volume():
@@ -47,9 +93,31 @@ def _check_postgres_persistent_volume():
         return False
 
 
+@functools.lru_cache(maxsize=8)
+def _docker_volume_created_at(name: str) -> str:
+    """Return the creation timestamp of a docker volume.
+
+    A volume's creation time never changes, so the `docker volume inspect`
+    call is made once per volume per process.
+    """
+    return subprocess.run(
+        ['docker', 'volume', 'inspect', name, '--format', '{{.CreatedAt}}'],
+        capture_output=True,
+        text=True,
+        timeout=5
+    ).stdout.strip()
+
+
+def _ensure_credential_dirs():
+    """Create the credentials and tokens directories if they are missing."""
+    for directory in (CREDENTIALS_DIR, TOKENS_DIR):
+        if not directory.is_dir():
+            directory.mkdir(parents=True, exist_ok=True)
+
+
 def _ensure_tomcat_users_file_exists():
     """Ensure tomcat-users.xml exists with minimal valid structure if missing."""
-    tomcat_file = CREDENTIALS_DIR / "tomcat-users.xml"
+    tomcat_file = TOMCAT_USERS_FILE
     if not tomcat_file.exists():
         # Create minimal valid XML file (empty = public access)
         minimal_xml = '''<?xml version="1.0" encoding="UTF-8"?>
@@ -64,50 +132,136 @@ def _ensure_tomcat_users_file_exists():
             f.write(minimal_xml)
 
 
+def _credentials_state_key():
+    """Snapshot the credential files and tokens directory for cache comparison.
+    
+    Returns:
+        Tuple of sorted (name, mtime_ns, size, inode) for every entry in
+        CREDENTIALS_DIR, plus the mtime of TOKENS_DIR
+    """
+    files = []
+    with os.scandir(CREDENTIALS_DIR) as entries:
+        for entry in entries:
+            stat = entry.stat()
+            files.append((entry.name, stat.st_mtime_ns, stat.st_size, entry.inode()))
+    files.sort()
+    try:
+        tokens_mtime = TOKENS_DIR.stat().st_mtime_ns
+    except OSError:
+        tokens_mtime = None
+    return (tuple(files), tokens_mtime)
+
+
+def _invalidate_credentials_cache():
+    """Drop the cached credential check so the next call re-reads the files.
+    
+    Per-file validation results are kept; they are keyed on each file's
+    mtime, size and inode, so only files that changed are revalidated.
+    """
+    _credentials_cache["value"] = None
+
+
 def _check_existing_and_valid_credentials():
-    """Check which credentials already exist and validate their structure."""
-    CREDENTIALS_DIR.mkdir(parents=True, exist_ok=True)
-    TOKENS_DIR.mkdir(parents=True, exist_ok=True)
+    """
+    Check which credentials already exist and validate their structure.
     
-    # Ensure tomcat-users.xml exists (needed for Docker Compose mount)
-    _ensure_tomcat_users_file_exists()
+    Validation is cached and only rerun when a file in the credentials
+    directory or the set of token files changes, or after
+    _invalidate_credentials_cache. Each call returns fresh copies, so
+    callers may update them.
     
-    # Check if first-time setup (no mandatory files exist)
-    mandatory_files = [
-        CREDENTIALS_DIR / "frost_credentials.json",
-        CREDENTIALS_DIR / "postgres_credentials.json",
-        CREDENTIALS_DIR / "mqtt_credentials.json",
-    ]
+    Returns:
+        Tuple of (existing, validation_results): whether each credential
+        exists and is valid plus the list of token names, and the
+        (is_valid, errors) result for each validated credential type
+    """
+    _ensure_credential_dirs()
+    
+    key = _credentials_state_key()
+    if not any(entry[0] == TOMCAT_USERS_FILE.name for entry in key[0]):
+        # Ensure tomcat-users.xml exists (needed for Docker Compose mount)
+        _ensure_tomcat_users_file_exists()
+        key = _credentials_state_key()
+    if _credentials_cache["value"] is None or _credentials_cache["key"] != key:
+        present = {entry[0]: entry[1:] for entry in key[0]}
+        _credentials_cache.update(key=key, value=_read_existing_and_valid_credentials(present))
+    
+    existing, validation_results = _credentials_cache["value"]
+    existing = dict(existing)
+    existing['tokens'] = list(existing['tokens'])
+    return existing, dict(validation_results)
+
+
+def _validate_credential_file(cred_type, signature):
+    """Validate one credential file, reusing the result while it is unchanged.
+    
+    Args:
+        cred_type: Key into CREDENTIAL_VALIDATORS, e.g. 'frost'
+        signature: (mtime_ns, size, inode) of the file, or None if missing
+    
+    Returns:
+        Tuple of (is_valid, list_of_errors)
+    """
+    cached = _file_validation_cache.get(cred_type)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    path, validator = CREDENTIAL_VALIDATORS[cred_type]
+    result = validator(path)
+    _file_validation_cache[cred_type] = (signature, result)
+    return result
+
+
+def _read_existing_and_valid_credentials(present):
+    """Check which credential files exist and validate their structure.
+    
+    Args:
+        present: Mapping of entry name in CREDENTIALS_DIR to its
+            (mtime_ns, size, inode) signature, taken from the same listing
+            as the cache key
     
-    is_first_time = not any(f.exists() for f in mandatory_files)
+    Returns:
+        Tuple of (existing, validation_results)
+    """
+    files_exist = {
+        'frost': FROST_CREDENTIALS_FILE.name in present,
+        'postgres': POSTGRES_CREDENTIALS_FILE.name in present,
+        'mqtt': MQTT_CREDENTIALS_FILE.name in present,
+    }
+    
+    # Check if first-time setup (no mandatory files exist)
+    is_first_time = not any(files_exist.values())
     
     if is_first_time:
         # Skip validation, just check existence
         validation_results = {
-            'frost': (False, []),
-            'postgres': (False, []),
-            'mqtt': (False, []),
+            'frost': NOT_VALIDATED,
+            'postgres': NOT_VALIDATED,
+            'mqtt': NOT_VALIDATED,
         }
     else:
-        # Run full validation
-        validation_results = validate_all_credentials(CREDENTIALS_DIR)
+        # Validate, reusing results for files that have not changed
+        validation_results = {
+            cred_type: _validate_credential_file(cred_type, present.get(path.name))
+            for cred_type, (path, _) in CREDENTIAL_VALIDATORS.items()
+        }
     
     existing = {
-        'frost': (CREDENTIALS_DIR / "frost_credentials.json").exists() and validation_results['frost'][0],
-        'postgres': (CREDENTIALS_DIR / "postgres_credentials.json").exists() and validation_results['postgres'][0],
-        'mqtt': (CREDENTIALS_DIR / "mqtt_credentials.json").exists() and validation_results['mqtt'][0],
-        'tomcat': (CREDENTIALS_DIR / "tomcat-users.xml").exists(),
+        cred_type: exists and validation_results[cred_type][0]
+        for cred_type, exists in files_exist.items()
     }
-    
-    # Store validation results for later use
-    existing['_validation_results'] = validation_results
+    existing['tomcat'] = TOMCAT_USERS_FILE.name in present
     
     # List existing token files
-    existing['tokens'] = [
-        f.stem for f in TOKENS_DIR.glob("*.json")
-    ] if TOKENS_DIR.exists() else []
+    try:
+        with os.scandir(TOKENS_DIR) as entries:
+            existing['tokens'] = [
+                entry.name[:-len(".json")] for entry in entries
+                if entry.name.endswith(".json")
+            ]
+    except FileNotFoundError:
+        existing['tokens'] = []
     
-    return existing
+    return existing, validation_results
 
 
 def _check_valid_credentials(credential_file: Path) -> bool:
@@ -123,11 +277,9 @@ def _check_valid_credentials(credential_file: Path) -> bool:
 
 def _get_missing_mandatory(existing):
     """Get list of missing mandatory credentials."""
-    mandatory = ['frost', 'postgres', 'mqtt']
-    return [cred for cred in mandatory if not existing.get(cred, False)]
+    return [cred for cred in MANDATORY_CREDENTIALS if not existing.get(cred, False)]
 
 
 def _is_first_time_setup(existing):
     """Check if this is a first-time setup (no credentials exist)."""
-    mandatory = ['frost', 'postgres', 'mqtt']
-    return not any(existing.get(cred, False) for cred in mandatory)
+    return not any(existing.get(cred, False) for cred in MANDATORY_CREDENTIALS)
@@ -11,6 +11,7 @@ from rich.table import Table
 
 # internal
 from ..paths import TOKENS_DIR
+from .system_checks import _invalidate_credentials_cache
 
 console = Console()
 
@@ -21,6 +22,8 @@ def _setup_token_file(token_name: str = None):
     Args:
         token_name: Optional token file name to pre-fill (without .json extension).
     """
+    from .applications import _invalidate_application_status
+    
     console.print(Panel.fit(
         "[bold]Token Files (Freeform JSON)[/bold]",
         border_style="blue"
@@ -47,6 +50,8 @@ def _setup_token_file(token_name: str = None):
         token_file = TOKENS_DIR / f"{token_name}.json"
         with open(token_file, "w") as f:
             json.dump(token_data, f, indent=4)
+        _invalidate_application_status()
+        _invalidate_credentials_cache()
         console.print(f"[green]✓ Created/Updated {token_file}[/green]")
         return True
     return False
@@ -39,6 +39,16 @@ URL = str
 main_logger = logging.getLogger("main")
 event_logger = logging.getLogger("events")
 debug_logger = logging.getLogger("debug")
+# names of concrete connection classes, registered by __init_subclass__
+HTTP_CONNECTION_CLASSES: list[str] = []
+MQTT_CONNECTION_CLASSES: list[str] = []
+
+
+def _register_connection_class(cls: type, registry: list[str]) -> None:
+    """Add a concrete class named `*Connection` to a connection class registry."""
+    if inspect.isabstract(cls) or not cls.__name__.endswith("Connection"):
+        return
+    registry.append(cls.__name__)
 
 
 class SensorApplicationConnection(ABC):
@@ -246,6 +256,10 @@ class HTTPSensorApplicationConnection(SensorApplicationConnection, ABC):
         self._last_payload: Any = None
         self._authenticated: bool = False
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_connection_class(cls, HTTP_CONNECTION_CLASSES)
+
     def _pull_transform_push_loop(self) -> None:
         """
         Loop requests until failure.
@@ -315,6 +329,10 @@ class MQTTSensorApplicationConnection(SensorApplicationConnection, ABC):
         self._subscribed: bool = False
         self._mqtt_client = mqttClient(CallbackAPIVersion.VERSION2)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        _register_connection_class(cls, MQTT_CONNECTION_CLASSES)
+
     def _pull_data(self) -> None:
         """
         Establishes MQTT connection, subscribes to topic, and starts receiving messages.
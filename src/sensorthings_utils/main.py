@@ -118,8 +118,9 @@ def push_available(
     time.sleep(start_delay)
     # INITIAL SETUP ############################################################
     sensor_registry: dict[SensorID, SupportedSensors] = {}
+    excluded = frozenset(exclude or ())
     for f in sensor_config_paths:
-        if exclude and f.name in exclude:
+        if f.name in excluded:
             continue
         sensor_config = SensorConfig(f)
         sensor_registry[sensor_config.name] = SupportedSensors(sensor_config.model)
@@ -12,6 +12,11 @@ __all__ = [
     "TOKENS_DIR",
     "TEST_DATA_DIR",
     "APPLICATION_CONFIG_FILE",
+    "FROST_CREDENTIALS_FILE",
+    "POSTGRES_CREDENTIALS_FILE",
+    "MQTT_CREDENTIALS_FILE",
+    "TOMCAT_USERS_FILE",
+    "APPLICATION_CREDENTIALS_FILE",
     "START_SCRIPT",
     "STOP_SCRIPT"
 ]
@@ -27,6 +32,12 @@ CONFIG_PATHS = DEPLOY_DIR / "sensor_configs"
 CREDENTIALS_DIR = DEPLOY_DIR / "secrets" / "credentials"
 TOKENS_DIR = DEPLOY_DIR / "secrets" / "tokens"
 TEST_DATA_DIR = ROOT_DIR / "tests" / "sensorthings_utils" / "data"
+# Credential files
+FROST_CREDENTIALS_FILE = CREDENTIALS_DIR / "frost_credentials.json"
+POSTGRES_CREDENTIALS_FILE = CREDENTIALS_DIR / "postgres_credentials.json"
+MQTT_CREDENTIALS_FILE = CREDENTIALS_DIR / "mqtt_credentials.json"
+TOMCAT_USERS_FILE = CREDENTIALS_DIR / "tomcat-users.xml"
+APPLICATION_CREDENTIALS_FILE = CREDENTIALS_DIR / "application_credentials.json"
 
 # APPLICATION_CONFIG_FILE - find the first application-configs yaml/yml file
 # Default to application-configs.yml if not found (allows creation)
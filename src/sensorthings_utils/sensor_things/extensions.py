@@ -34,6 +34,69 @@ __all__ = ["SensorConfig", "SensorArrangement"]
 
 main_logger = logging.getLogger("main")
 
+# Prefer the libyaml-backed C loader, falling back to pure Python.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Expected structure of a sensor config file, built once and shared by every
+# SensorConfig validation.
+EXPECTED_TOP_LEVEL_KEYS = (
+    "sensors",
+    "things",
+    "locations",
+    "datastreams",
+    "observedProperties",
+)
+EXPECTED_CLASS_FIELDS: Dict[str, Dict[str, Any]] = {
+    "sensors": {
+        "name": str,
+        "description": (str, dict),
+        "properties": (str, dict),
+        "encodingType": str,
+        "metadata": str,
+        "iot_links": dict,
+    },
+    "things": {
+        "name": str,
+        "description": str,
+        "properties": (str, dict, type(None)),
+        "iot_links": dict,
+    },
+    "locations": {
+        "name": str,
+        "description": str,
+        "properties": (str, dict, type(None)),
+        "encodingType": str,
+        "location": dict,
+        "iot_links": dict,
+    },
+    "datastreams": {
+        "name": str,
+        "description": str,
+        "observationType": str,
+        "unitOfMeasurement": dict,
+        "observedArea": dict,
+        "phenomenon_time": (str, type(None)),
+        "result_time": (str, type(None)),
+        "properties": (dict, type(None)),
+        "iot_links": dict,
+    },
+    "observedProperties": {
+        "name": str,
+        "definition": str,
+        "description": str,
+        "properties": (str, type(None)),
+    },
+}
+EXPECTED_FIELD_KEYS = {
+    entity: set(fields) for entity, fields in EXPECTED_CLASS_FIELDS.items()
+}
+EXPECTED_IOT_LINK_GROUPS = {
+    "sensors": {"datastreams"},
+    "things": {"datastreams", "locations"},
+    "locations": {"things"},
+    "datastreams": {"observedProperties", "sensors", "things"},
+}
+
 
 class SensorConfig:
     """
@@ -44,19 +107,38 @@ class SensorConfig:
     Args
         - data (Dict[str, Any]) - contents of the sensor config.
         - is_valid (bool)
+        - validation_messages (list[str]) - errors, or a success message
         - model (str) - sensor model
         - name (str) - sensor name
     """
 
-    def __init__(self, filepath: str | Path) -> None:
-        self._filepath = Path(filepath)
-        self.data: Dict[str, Any] = self._load()
-        self.is_valid = self.check_validity()[0]
-        self._set_metadata()
+    def __init__(
+        self, filepath: str | Path, *, resolve_metadata: bool = True
+    ) -> None:
+        self.is_valid, self.validation_messages = self._load_and_check(filepath)
+        if resolve_metadata:
+            self._set_metadata()
         # below metadata attrs set by fn above
         self.model: SupportedSensors
         self.name: SensorID
 
+    @classmethod
+    def validate(cls, filepath: str | Path) -> Tuple[bool, list[str]]:
+        """
+        Load and validate a configuration file in a single pass.
+
+        Sensor metadata is not resolved, so this also reports on configs too
+        broken to construct normally.
+        """
+        config = cls(filepath, resolve_metadata=False)
+        return config.is_valid, config.validation_messages
+
+    def _load_and_check(self, filepath: str | Path) -> Tuple[bool, list[str]]:
+        """Load the configuration file and run the validation checks once."""
+        self._filepath = Path(filepath)
+        self.data: Dict[str, Any] = self._load()
+        return self.check_validity()
+
     def _set_metadata(self) -> None:
         """Set sensor metadata attrs."""
         model = next(iter(self.data["sensors"]))
@@ -66,7 +148,7 @@ class SensorConfig:
     def _load(self) -> Dict:
         """Safely load configuration file."""
         with open(self._filepath, "r") as file:
-            data = yaml.safe_load(file)
+            data = yaml.load(file, Loader=YAML_LOADER)
         return data
 
     # TODO: poor logic to be rewritten.
@@ -119,58 +201,11 @@ class SensorConfig:
         self, unvalidated_data: Dict
     ) -> Tuple[bool, List[str]]:
         "Check that primary sensor things keys are there, and that the contents are as expected."
-        expected_top_level_keys = [
-            "sensors",
-            "things",
-            "locations",
-            "datastreams",
-            "observedProperties",
-        ]
-        expected_class_fields = {
-            "sensors": {
-                "name": str,
-                "description": (str, dict),
-                "properties": (str, dict),
-                "encodingType": str,
-                "metadata": str,
-                "iot_links": dict,
-            },
-            "things": {
-                "name": str,
-                "description": str,
-                "properties": (str, dict, type(None)),
-                "iot_links": dict,
-            },
-            "locations": {
-                "name": str,
-                "description": str,
-                "properties": (str, dict, type(None)),
-                "encodingType": str,
-                "location": dict,
-                "iot_links": dict,
-            },
-            "datastreams": {
-                "name": str,
-                "description": str,
-                "observationType": str,
-                "unitOfMeasurement": dict,
-                "observedArea": dict,
-                "phenomenon_time": (str, type(None)),
-                "result_time": (str, type(None)),
-                "properties": (dict, type(None)),
-                "iot_links": dict,
-            },
-            "observedProperties": {
-                "name": str,
-                "definition": str,
-                "description": str,
-                "properties": (str, type(None)),
-            },
-        }
+        expected_class_fields = EXPECTED_CLASS_FIELDS
         # entity is going to be sensors, things, locations, etc.
         invalid = False
         error_list = []
-        for key in expected_top_level_keys:
+        for key in EXPECTED_TOP_LEVEL_KEYS:
             # Check if all top level keys are there:
             if (actual_entity := unvalidated_data.get(key)) is None:
                 error = f"{self._filepath.stem} is missing primary key: {key}. \
@@ -186,16 +221,17 @@ class SensorConfig:
                 error_list.append(error)
                 return (False, error_list)
             # item is going to be each entry, e.g., 70:33:50.. (sensor), "apartment" (location)
-            expected_field_keys = set(expected_class_fields[key].keys())
-            for field_key in actual_entity:
-                if not isinstance(actual_entity[field_key], dict):
+            expected_fields = expected_class_fields[key]
+            expected_field_keys = EXPECTED_FIELD_KEYS[key]
+            for field_key, fields in actual_entity.items():
+                if not isinstance(fields, dict):
                     error = f"{self._filepath.stem}'s {field_key}'s children are of \
-                        type {type(actual_entity[field_key])} not dict. \
+                        type {type(fields)} not dict. \
                         Will not continue with validation."
                     main_logger.error(error)
                     error_list.append(error)
                     return (False, error_list)
-                actual_field_keys = set(actual_entity[field_key].keys())
+                actual_field_keys = fields.keys()
                 missing_field_keys = expected_field_keys - actual_field_keys
                 extra_field_keys = actual_field_keys - expected_field_keys
                 if missing_field_keys:
@@ -208,12 +244,15 @@ class SensorConfig:
                     main_logger.error(error)
                     error_list.append(error)
                     invalid = True
-                for field in actual_entity[field_key]:
-                    expected_type = expected_class_fields[key][field]
-                    if not isinstance(actual_entity[field_key][field], expected_type):
+                for field, value in fields.items():
+                    expected_type = expected_fields.get(field)
+                    # extra keys are reported above and have no expected type
+                    if expected_type is None:
+                        continue
+                    if not isinstance(value, expected_type):
                         error = (
                             f"{key}.{field_key}.{field} is of the wrong type "
-                            + f"expected {expected_type}, got {type(actual_entity[field_key][field])}"
+                            + f"expected {expected_type}, got {type(value)}"
                         )
                         error_list.append(error)
                         main_logger.error(error)
@@ -240,12 +279,7 @@ class SensorConfig:
     ) -> Tuple[bool, List[str]]:
         """Validate a series of expected links between entities."""
 
-        expected_iot_link_groups = {
-            "sensors": ["datastreams"],
-            "things": ["datastreams", "locations"],
-            "locations": ["things"],
-            "datastreams": ["observedProperties", "sensors", "things"],
-        }
+        expected_iot_link_groups = EXPECTED_IOT_LINK_GROUPS
 
         invalid = False
         error_list = []
@@ -260,8 +294,9 @@ class SensorConfig:
                 for entity, entity_fields in entity_instances.items():
                     passed_links = entity_fields["iot_links"]
                     exp_links = expected_iot_link_groups[entity_type]
-                    extra_links = set(passed_links) - set(exp_links)
-                    missing_links = set(exp_links) - set(passed_links)
+                    passed_link_keys = set(passed_links)
+                    extra_links = passed_link_keys - exp_links
+                    missing_links = exp_links - passed_link_keys
                     if extra_links:
                         error = (
                             f"{self._filepath.name}.{entity_type}."
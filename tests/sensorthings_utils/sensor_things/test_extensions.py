@@ -38,3 +38,36 @@ class TestSensorConfig:
         bad_config, logs = bad_sensor_name
         assert bad_config.is_valid == False
         assert "does not match its primary key" in logs
+
+    def test_validate_good_config(self):
+        is_valid, messages = SensorConfig.validate(
+            TEST_DATA_DIR / "complete_sensor_config.yaml"
+        )
+        assert is_valid is True
+        assert messages == ["complete_sensor_config.yaml is a valid config."]
+
+    @pytest.mark.parametrize(
+        "filename, error",
+        [
+            (
+                "missing_sensor_field.yaml",
+                "sensors.70:ee:50:7f:9d:32 has missing keys: {'metadata'}.",
+            ),
+            # an unknown field is reported once, not also as a wrong type
+            (
+                "extra_sensor_field.yaml",
+                "sensors.70:ee:50:7f:9d:32 has extra keys: {'colour'}.",
+            ),
+        ],
+    )
+    def test_validate_invalid_config(self, filename, error):
+        is_valid, messages = SensorConfig.validate(TEST_DATA_DIR / filename)
+        assert is_valid is False
+        assert messages == [f"{filename} is an invalid config.", error]
+
+    def test_validate_matches_constructor(self):
+        path = TEST_DATA_DIR / "missing_sensor_field.yaml"
+        config = SensorConfig(path)
+        assert (config.is_valid, config.validation_messages) == (
+            SensorConfig.validate(path)
+        )
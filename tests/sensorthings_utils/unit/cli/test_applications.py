@@ -0,0 +1,74 @@
+"""Test cli/applications.py"""
+
+# external
+import pytest
+from rich.prompt import Prompt
+
+# internal
+from sensorthings_utils.cli.applications import (
+    CONNECTION_FIELDS,
+    _prompt_fields,
+    _prompt_optional_int,
+)
+
+
+@pytest.fixture
+def answers(monkeypatch):
+    """Feed queued answers to Prompt.ask, returning the default on empty input."""
+    queue = []
+
+    def ask(prompt, **kwargs):
+        answer = queue.pop(0)
+        if answer == "" and "default" in kwargs:
+            return kwargs["default"]
+        return answer
+
+    monkeypatch.setattr(Prompt, "ask", ask)
+    return queue
+
+
+class TestPromptOptionalInt:
+    """Test the optional integer prompt."""
+
+    @pytest.mark.parametrize(
+        "typed, expected",
+        [
+            ([""], None),
+            (["-3"], -3),
+            (["abc", "7"], 7),
+            (["²", "5"], 5),
+        ],
+    )
+    def test_parses_or_asks_again(self, answers, typed, expected):
+        answers.extend(typed)
+        assert _prompt_optional_int("Value") == expected
+        assert answers == []
+
+
+class TestPromptFields:
+    """Test prompting for connection-specific fields."""
+
+    def test_required_field_asks_again_on_empty(self, answers):
+        # max_retries, host (empty, then given), port (default), topic, expected_sensors
+        answers.extend(["", "", "broker.example.org", "", "sensors/#", ""])
+        new_config = {}
+        _prompt_fields(CONNECTION_FIELDS["mqtt"], {}, new_config)
+        assert answers == []
+        assert new_config == {
+            "host": "broker.example.org",
+            "port": 8883,
+            "topic": "sensors/#",
+        }
+
+    def test_optional_field_keeps_current_value(self, answers):
+        answers.extend(["", "", ""])
+        current_config = {"interval": 30, "max_retries": 2}
+        new_config = {}
+        _prompt_fields(CONNECTION_FIELDS["http"], current_config, new_config)
+        assert new_config == {"interval": 30, "max_retries": 2}
+
+    def test_int_fields_are_coerced(self, answers):
+        answers.extend(["60", "3", "4"])
+        new_config = {}
+        _prompt_fields(CONNECTION_FIELDS["http"], {}, new_config)
+        assert new_config == {"interval": 60, "max_retries": 3, "expected_sensors": 4}
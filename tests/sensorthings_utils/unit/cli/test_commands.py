@@ -0,0 +1,46 @@
+"""Test cli/commands.py"""
+
+# external
+import yaml
+from typer.testing import CliRunner
+
+# internal
+from sensorthings_utils.cli.commands import app
+
+runner = CliRunner()
+
+
+class TestGenerateConfig:
+    """Test the generate-config command."""
+
+    def test_reads_piped_answers(self, tmp_path):
+        output = tmp_path / "generated.yaml"
+        answers = "\n".join(
+            [
+                "70:ee:50:00:00:01",
+                "Room 1",
+                "A test room.",
+                "Test Building",
+                "The test building.",
+                "4.37",
+                "52.0",
+            ]
+        )
+        result = runner.invoke(
+            app, ["generate-config", "netatmo.nws03", "-o", str(output)], input=answers
+        )
+        assert result.exit_code == 0, result.output
+        config = yaml.safe_load(output.read_text())
+        assert config["sensors"]["netatmo.nws03"]["name"] == "70:ee:50:00:00:01"
+        assert config["things"]["Room 1"]["description"] == "A test room."
+        location = config["locations"]["Test Building"]
+        assert location["description"].startswith("Room 1 on the First Floor")
+        assert location["location"]["coordinates"] == [4.37, 52.0]
+
+    def test_missing_answer_fails(self, tmp_path):
+        output = tmp_path / "generated.yaml"
+        result = runner.invoke(
+            app, ["generate-config", "netatmo.nws03", "-o", str(output)], input=""
+        )
+        assert result.exit_code == 1
+        assert not output.exists()
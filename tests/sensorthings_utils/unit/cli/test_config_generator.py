@@ -0,0 +1,41 @@
+"""Test cli/config_generator.py"""
+
+# external
+import pytest
+import yaml
+
+# internal
+from sensorthings_utils.cli.config_generator import (
+    TEMPLATE_PATHS,
+    _load_template,
+    _replace_placeholders,
+)
+from sensorthings_utils.config import TEST_DATA_DIR
+
+SUBSTITUTIONS = {
+    "<SENSOR_ID>": "70:ee:50:00:00:01",
+    "<THING_NAME>": "Room 1",
+    "<THING_DESCRIPTION>": "A test room.",
+    "<LOCATION_NAME>": "Test Building",
+    "<LOCATION_DESCRIPTION>": "The test building.",
+    "<LONGITUDE>": 4.37,
+    "<LATITUDE>": 52.0,
+}
+
+
+class TestReplacePlaceholders:
+    """Test rendering the sensor config templates."""
+
+    @pytest.mark.parametrize("sensor_model", TEMPLATE_PATHS, ids=lambda m: m.value)
+    def test_renders_template(self, sensor_model):
+        rendered = _replace_placeholders(_load_template(sensor_model), SUBSTITUTIONS)
+        with open(TEST_DATA_DIR / f"generated_{sensor_model.value}.yaml") as f:
+            expected = yaml.safe_load(f)
+        assert rendered == expected
+
+    def test_leaves_template_untouched(self):
+        sensor_model = next(iter(TEMPLATE_PATHS))
+        template = _load_template(sensor_model)
+        before = yaml.safe_dump(template)
+        _replace_placeholders(template, SUBSTITUTIONS)
+        assert yaml.safe_dump(template) == before
@@ -0,0 +1,52 @@
+"""Test cli/files.py"""
+
+# standard
+import os
+import stat
+
+# external
+import pytest
+
+# internal
+from sensorthings_utils.cli.files import _atomic_open, _write_in_place
+
+
+def _mode(path):
+    return stat.S_IMODE(path.stat().st_mode)
+
+
+class TestAtomicOpen:
+    """Test the atomic file replacement helper."""
+
+    def test_keeps_existing_mode(self, tmp_path):
+        path = tmp_path / "secret.json"
+        path.write_text("old")
+        os.chmod(path, 0o600)
+        with _atomic_open(path) as f:
+            f.write("new")
+        assert path.read_text() == "new"
+        assert _mode(path) == 0o600
+
+    def test_failed_write_keeps_original(self, tmp_path):
+        path = tmp_path / "secret.json"
+        path.write_text("old")
+        with pytest.raises(RuntimeError):
+            with _atomic_open(path) as f:
+                f.write("partial")
+                raise RuntimeError
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["secret.json"]
+
+
+class TestWriteInPlace:
+    """Test the in-place writer used for bind-mounted files."""
+
+    def test_keeps_inode_and_mode(self, tmp_path):
+        path = tmp_path / "tomcat-users.xml"
+        path.write_text("old")
+        os.chmod(path, 0o600)
+        inode = path.stat().st_ino
+        _write_in_place(path, "new")
+        assert path.read_text() == "new"
+        assert path.stat().st_ino == inode
+        assert _mode(path) == 0o600
@@ -0,0 +1,35 @@
+"""Test the connection class registries in connections.py"""
+
+# standard
+from abc import ABC
+
+# internal
+from sensorthings_utils.connections import (
+    HTTP_CONNECTION_CLASSES,
+    MQTT_CONNECTION_CLASSES,
+    HTTPSensorApplicationConnection,
+)
+
+
+class TestConnectionRegistry:
+    """Test registration of connection classes on definition."""
+
+    def test_concrete_connections_registered(self):
+        assert "NetatmoConnection" in HTTP_CONNECTION_CLASSES
+        assert "TTSConnection" in MQTT_CONNECTION_CLASSES
+
+    def test_abstract_subclass_skipped(self):
+        class AbstractTestConnection(HTTPSensorApplicationConnection, ABC):
+            pass
+
+        assert "AbstractTestConnection" not in HTTP_CONNECTION_CLASSES
+
+    def test_unsuffixed_subclass_skipped(self):
+        class HelperClient(HTTPSensorApplicationConnection):
+            def _auth(self):
+                pass
+
+            def _pull_data(self):
+                pass
+
+        assert "HelperClient" not in HTTP_CONNECTION_CLASSES